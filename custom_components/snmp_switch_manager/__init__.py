@@ -3,9 +3,11 @@ from __future__ import annotations
 from datetime import timedelta
 import logging
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
@@ -18,6 +20,8 @@ from .const import (
     CONF_OVERRIDE_PORT,
     CONF_UPTIME_POLL_INTERVAL,
     DEFAULT_UPTIME_POLL_INTERVAL,
+    CONF_MAX_REPETITIONS,
+    DEFAULT_MAX_REPETITIONS,
     CONF_BW_ENABLE,
     CONF_BW_INCLUDE_STARTS_WITH,
     CONF_BW_INCLUDE_CONTAINS,
@@ -51,7 +55,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: SwitchManagerConfigEntry
         CONF_BW_EXCLUDE_ENDS_WITH: entry.options.get(CONF_BW_EXCLUDE_ENDS_WITH, []) or [],
         CONF_BANDWIDTH_POLL_INTERVAL: entry.options.get(CONF_BANDWIDTH_POLL_INTERVAL, DEFAULT_BANDWIDTH_POLL_INTERVAL),
     })
-    await client.async_initialize()
+    client.set_max_repetitions(entry.options.get(CONF_MAX_REPETITIONS, DEFAULT_MAX_REPETITIONS))
+    try:
+        await client.async_initialize()
+    except UpdateFailed as err:
+        raise ConfigEntryNotReady(str(err)) from err
 
     # Apply per-device option for sysUpTime throttling
     client.set_uptime_poll_interval(entry.options.get(CONF_UPTIME_POLL_INTERVAL, DEFAULT_UPTIME_POLL_INTERVAL))
@@ -62,12 +70,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: SwitchManagerConfigEntry
         name=f"{DOMAIN}-coordinator-{host}",
         update_interval=timedelta(seconds=DEFAULT_POLL_INTERVAL),
         update_method=client.async_poll,
+        # Polls return a fresh snapshot; skip entity updates when nothing changed.
+        always_update=False,
     )
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
+    # Entity name prefix and device name, resolved once for every platform.
+    host_label = client.cache.get("sysName") or entry.data.get("name") or client.host
+
+    # Runtime objects live on the entry itself (one attribute load to reach
+    # them); lookups by entry_id go through the config entries manager.
+    entry.runtime_data = {
         "client": client,
         "coordinator": coordinator,
+        "host_label": host_label,
+        "device_info": _build_device_info(client, host_label),
     }
 
     # Register services (idempotent)
@@ -78,6 +95,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: SwitchManagerConfigEntry
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
     return True
 
+def _build_device_info(client: SwitchSnmpClient, host_label: str) -> DeviceInfo:
+    """Device registry info shared by every entity of this entry."""
+    manufacturer = client.cache.get("manufacturer")
+    model = client.cache.get("model")
+    firmware = client.cache.get("firmware")
+    return DeviceInfo(
+        identifiers={(DOMAIN, f"{client.host}:{client.port}:{client.community}")},
+        manufacturer=manufacturer if manufacturer and manufacturer != "Unknown" else None,
+        model=model if model and model != "Unknown" else None,
+        sw_version=firmware if firmware and firmware != "Unknown" else None,
+        name=host_label,
+    )
+
 async def _async_update_listener(hass: HomeAssistant, entry: SwitchManagerConfigEntry) -> None:
     await hass.config_entries.async_reload(entry.entry_id)
 
@@ -85,7 +115,7 @@ async def _async_update_listener(hass: HomeAssistant, entry: SwitchManagerConfig
 async def async_unload_entry(hass: HomeAssistant, entry: SwitchManagerConfigEntry) -> bool:
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry.runtime_data["client"].close()
     return unloaded
 
 async def async_register_services(hass: HomeAssistant):
@@ -101,11 +131,11 @@ async def async_register_services(hass: HomeAssistant):
             return
 
         # Resolve the integration entry and client from the entity's config_entry_id
-        entry_id = ent.config_entry_id
-        data = hass.data.get(DOMAIN, {}).get(entry_id)
-        if not data:
+        entry = hass.config_entries.async_get_entry(ent.config_entry_id)
+        if entry is None or entry.state is not ConfigEntryState.LOADED:
             return
 
+        data = entry.runtime_data
         client = data["client"]
         # Parse if_index from our unique_id pattern "<entry_id>-if-<index>"
         unique_id = ent.unique_id or ""
@@ -22,6 +22,10 @@ from .const import (
     DEFAULT_UPTIME_POLL_INTERVAL,
     MIN_UPTIME_POLL_INTERVAL,
     MAX_UPTIME_POLL_INTERVAL,
+    CONF_MAX_REPETITIONS,
+    DEFAULT_MAX_REPETITIONS,
+    MIN_MAX_REPETITIONS,
+    MAX_MAX_REPETITIONS,
     CONF_INCLUDE_STARTS_WITH,
     CONF_INCLUDE_CONTAINS,
     CONF_INCLUDE_ENDS_WITH,
@@ -102,6 +106,10 @@ OID_FIELDS = [
 ]
 
 
+# Dotted numeric OID (leading dot already stripped), e.g. 1.3.6.1.2.1.1.5.0
+_NUMERIC_OID_RE = re.compile(r"(\d+\.)*\d+")
+
+
 def _normalize_oid(value: str) -> str:
     v = (value or "").strip()
     if not v:
@@ -116,7 +124,7 @@ def _is_valid_numeric_oid(value: str) -> bool:
     v = _normalize_oid(value)
     if not v:
         return True
-    return bool(re.fullmatch(r"(\d+\.)*\d+", v))
+    return bool(_NUMERIC_OID_RE.fullmatch(v))
 
 
 def _split_list(value: str) -> list[str]:
@@ -481,6 +489,15 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
                 errors[CONF_UPTIME_POLL_INTERVAL] = "invalid_uptime_interval"
 
+            # GETBULK max-repetitions
+            reps_raw = str(user_input.get(CONF_MAX_REPETITIONS, "")).strip()
+            try:
+                reps_val = int(reps_raw)
+                if reps_val < MIN_MAX_REPETITIONS or reps_val > MAX_MAX_REPETITIONS:
+                    raise ValueError("out_of_range")
+                self._options[CONF_MAX_REPETITIONS] = reps_val
+            except Exception:
+                errors[CONF_MAX_REPETITIONS] = "invalid_max_repetitions"
 
             if not errors:
                 self._apply_options()
@@ -500,6 +517,10 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_UPTIME_POLL_INTERVAL,
                     default=str(self._options.get(CONF_UPTIME_POLL_INTERVAL, DEFAULT_UPTIME_POLL_INTERVAL)),
                 ): str,
+                vol.Optional(
+                    CONF_MAX_REPETITIONS,
+                    default=str(self._options.get(CONF_MAX_REPETITIONS, DEFAULT_MAX_REPETITIONS)),
+                ): str,
             }
         )
 
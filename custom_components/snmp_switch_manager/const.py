@@ -96,6 +96,16 @@ DEFAULT_BANDWIDTH_POLL_INTERVAL = 30  # seconds
 MIN_BANDWIDTH_POLL_INTERVAL = 5  # seconds
 MAX_BANDWIDTH_POLL_INTERVAL = 3600  # seconds
 
+CONF_MAX_REPETITIONS = "max_repetitions"
+DEFAULT_MAX_REPETITIONS = 25
+MIN_MAX_REPETITIONS = 5
+MAX_MAX_REPETITIONS = 50
+
+# Per-request SNMP timeout (seconds) and retry count. Sized for GETBULK
+# responses, which take the agent longer to build than single GETs.
+DEFAULT_SNMP_TIMEOUT = 2.0
+DEFAULT_SNMP_RETRIES = 2
+
 CONF_OVERRIDE_COMMUNITY = "override_community"
 CONF_OVERRIDE_PORT = "override_port" 
 
@@ -1,34 +1,48 @@
 
 from __future__ import annotations
 import ipaddress
-from typing import Optional, Dict, Any
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, Callable
+
+# Read-only default for lookups on coordinator data; never mutate it.
+EMPTY_DICT: Dict[str, Any] = {}
+
+# Two-letter name prefix -> display abbreviation (Port-channel/PortChannel
+# share the "po" prefix).
+_PREFIX_ABBR = {
+    "gi": "Gi",
+    "te": "Te",
+    "tw": "Tw",
+    "fa": "Fa",
+    "fi": "Fi",
+    "hu": "Hu",
+    "po": "Po",
+    "lo": "Lo",
+    "vl": "Vl",
+}
+
+# Speed tokens searched anywhere in the name, in priority order.
+_SPEED_TOKEN_ABBR = (
+    ("100g", "Hu"),
+    ("10g", "Te"),
+    ("20g", "Tw"),
+)
 
 def _abbr_from_speed_or_name(name: str) -> str:
     n = (name or "").lower()
-    if n.startswith("gi"):
-        return "Gi"
-    if n.startswith("te"):
-        return "Te"
-    if n.startswith("tw"):
-        return "Tw"
-    if n.startswith("fa"):
-        return "Fa"
-    if n.startswith("fi"):
-        return "Fi"
-    if n.startswith("hu"):
-        return "Hu"
-    if n.startswith("po") or n.startswith("port-channel") or n.startswith("portchannel"):
-        return "Po"
-    if n.startswith("lo"):
-        return "Lo"
-    if n.startswith("vl"):
-        return "Vl"
-    if "100g" in n: return "Hu"
-    if "10g" in n: return "Te"
-    if "20g" in n: return "Tw"
-    if "1g" in n or "1000" in n: return "Gi"
+    abbr = _PREFIX_ABBR.get(n[:2])
+    if abbr:
+        return abbr
+    for token, abbr in _SPEED_TOKEN_ABBR:
+        if token in n:
+            return abbr
+    # 1G/1000 names and anything unrecognized
     return "Gi"
 
+# Pure on its arguments, and the same interfaces are formatted on every
+# platform setup/reload.
+@lru_cache(maxsize=2048)
 def format_interface_name(raw_name: str, unit: int=1, slot: int=0, port: Optional[int]=None) -> str:
     rn = (raw_name or "").strip()
     # NOTE: Vendor-specific display normalizations (e.g., link aggregate -> Po)
@@ -40,7 +54,135 @@ def format_interface_name(raw_name: str, unit: int=1, slot: int=0, port: Optiona
         return f"{abbr}{unit}/{slot}/{port}"
     return rn
 
+def clean_match_list(values: Any) -> tuple[str, ...]:
+    """Normalize a user-entered match list: stripped, lowercased, no blanks.
+
+    A tuple, so it can key the name_matcher cache.
+    """
+    return tuple(str(s).strip().lower() for s in (values or []) if str(s).strip())
+
+# The same option lists are compiled by the switch and sensor platforms and
+# the bandwidth poller, and again on every entry reload.
+@lru_cache(maxsize=32)
+def name_matcher(
+    starts: tuple[str, ...], contains: tuple[str, ...], ends: tuple[str, ...]
+) -> Callable[[str], bool]:
+    """Build a test for a lowercased interface name against starts/contains/ends rules.
+
+    Prefixes and suffixes become single tuple startswith/endswith calls and
+    the substrings one alternation regex, so each name is scanned once per
+    rule kind instead of once per rule.
+    """
+    contains_search = (
+        re.compile("|".join(map(re.escape, contains))).search if contains else None
+    )
+
+    def _match(name_l: str) -> bool:
+        return (
+            name_l.startswith(starts)
+            or (contains_search is not None and contains_search(name_l) is not None)
+            or name_l.endswith(ends)
+        )
+
+    return _match
+
+_PORT_CHANNEL_PREFIXES = ("po", "port-channel", "link aggregate")
+
+def is_port_channel(name_l: str) -> bool:
+    """True for LAG interfaces (Po/Port-channel/link aggregate), lowercased name."""
+    return name_l.startswith(_PORT_CHANNEL_PREFIXES)
+
+def detect_vendor_family(manufacturer: Optional[str], sys_descr: Optional[str]) -> Optional[str]:
+    """Vendor family with built-in interface selection rules, if any."""
+    m = (manufacturer or "").lower()
+    d = (sys_descr or "").lower()
+    # Cisco SG family
+    if m.startswith("sg") and d.startswith("sg"):
+        return "cisco_sg"
+    # Junos / Juniper EX series
+    if "juniper" in m or "junos" in d or "ex2200" in d:
+        return "junos"
+    return None
+
+def vendor_filter_allows(
+    family: Optional[str],
+    name: str,
+    admin: Any,
+    oper: Any,
+    has_ip: bool,
+    disabled_ids: set[str],
+) -> bool:
+    """Apply the built-in vendor interface selection rules to one interface.
+
+    Returns True when no rule set applies (unknown vendor, or every rule of
+    the family disabled). Individual rules can be disabled by id.
+    """
+    # Most devices match no vendor family: skip lowercasing the name.
+    if family is None:
+        return True
+    lower = name.lower()
+    if family == "cisco_sg":
+        enable_physical = "cisco_sg_physical_fa_gi" not in disabled_ids
+        enable_vlan = "cisco_sg_vlan_admin_or_oper" not in disabled_ids
+        enable_has_ip = "cisco_sg_other_has_ip" not in disabled_ids
+        if not (enable_physical or enable_vlan or enable_has_ip):
+            return True
+        if enable_physical and lower.startswith(("fa", "gi")):
+            return True
+        if enable_vlan and lower.startswith("vlan"):
+            return oper == 1 or admin == 2
+        return enable_has_ip and has_ip
+
+    if family == "junos":
+        enable_physical = "junos_physical_ge" not in disabled_ids
+        enable_l3_subif = "junos_l3_subif_has_ip" not in disabled_ids
+        enable_vlan = "junos_vlan_admin_or_oper" not in disabled_ids
+        enable_has_ip = "junos_other_has_ip" not in disabled_ids
+        if not (enable_physical or enable_l3_subif or enable_vlan or enable_has_ip):
+            return True
+        # 1) Physical front-panel ports: ge-0/0/X (no subinterface suffix)
+        if enable_physical and lower.startswith("ge-") and "." not in name:
+            return True
+        # 2) L3 subinterfaces: ge-0/0/X.Y – only keep non-.0 with an IP address
+        if enable_l3_subif and lower.startswith("ge-") and "." in name:
+            return name.split(".", 1)[1] != "0" and has_ip
+        # 3) VLAN interfaces that are operationally up or administratively disabled
+        if enable_vlan and lower.startswith("vlan"):
+            return oper == 1 or admin == 2
+        # 4) Any other non-physical interface with an IP address configured
+        return enable_has_ip and has_ip
+
+    return True
+
+@lru_cache(maxsize=64)
+def mask_to_prefix(mask: str | None) -> Optional[int]:
+    """Prefix length of a dotted netmask, or None if it is not a valid mask."""
+    if not mask:
+        return None
+    try:
+        a, b, c, d = (int(p) for p in mask.split("."))
+        if not (0 <= a <= 255 and 0 <= b <= 255 and 0 <= c <= 255 and 0 <= d <= 255):
+            return None
+        x = (a << 24) | (b << 16) | (c << 8) | d
+        # A valid mask is a run of ones followed by zeros, i.e. its
+        # complement is of the form 2**n - 1.
+        inv = x ^ 0xFFFFFFFF
+        if inv & (inv + 1):
+            return None
+        return bin(x).count("1")
+    except Exception:
+        return None
+
 def ip_to_cidr(ip: str, mask: str) -> Optional[str]:
+    # Dotted netmasks (the common case) go through the cached conversion;
+    # only other mask forms need a network object.
+    prefix = mask_to_prefix(mask) if isinstance(mask, str) else None
+    if prefix is not None:
+        try:
+            ipaddress.IPv4Address(ip)
+        except Exception:
+            return None
+        return f"{ip}/{prefix}"
     try:
         net = ipaddress.IPv4Network((ip, mask), strict=False)
         return f"{ip}/{net.prefixlen}"
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import logging
 from homeassistant.util import slugify
+from homeassistant.core import callback
 from homeassistant.const import EntityCategory
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass, SensorStateClass
 
-from .const import DOMAIN, CONF_BW_ENABLE, CONF_BW_INCLUDE_STARTS_WITH, CONF_BW_INCLUDE_CONTAINS, CONF_BW_INCLUDE_ENDS_WITH, CONF_BW_EXCLUDE_STARTS_WITH, CONF_BW_EXCLUDE_CONTAINS, CONF_BW_EXCLUDE_ENDS_WITH
+from .const import CONF_BW_ENABLE, CONF_BW_INCLUDE_STARTS_WITH, CONF_BW_INCLUDE_CONTAINS, CONF_BW_INCLUDE_ENDS_WITH, CONF_BW_EXCLUDE_STARTS_WITH, CONF_BW_EXCLUDE_CONTAINS, CONF_BW_EXCLUDE_ENDS_WITH
 from .snmp import SwitchSnmpClient
+from .helpers import (
+    EMPTY_DICT,
+    clean_match_list,
+    detect_vendor_family,
+    is_port_channel,
+    name_matcher,
+    vendor_filter_allows,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +31,7 @@ SENSOR_TYPES = {
 }
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    data = entry.runtime_data
     client: SwitchSnmpClient = data["client"]
     coordinator = data["coordinator"]
 
@@ -32,7 +41,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
     firmware = client.cache.get("firmware") or "Unknown"
 
     hostname = client.cache.get("sysName")
-    host_label = hostname or entry.data.get("name") or client.host
+    host_label = data["host_label"]
     uptime_ticks = client.cache.get("sysUpTime")
 
     # Convert sysUpTime (hundredths of seconds) to human string
@@ -47,13 +56,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         except Exception:
             return str(ticks) if ticks is not None else "Unknown"
 
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, f"{client.host}:{client.port}:{client.community}")},
-        manufacturer=manufacturer if manufacturer != "Unknown" else None,
-        model=model if model != "Unknown" else None,
-        sw_version=firmware if firmware != "Unknown" else None,
-        name=host_label,
-    )
+    device_info = data["device_info"]
 
     entities = [
         SimpleTextSensor(coordinator, entry, "manufacturer", manufacturer, device_info, host_label),
@@ -68,7 +71,6 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     bw_enabled = bool(entry.options.get(CONF_BW_ENABLE, False))
     desired_bw_unique_ids: set[str] = set()
-    bw_entities: list[SensorEntity] = []
 
     if bw_enabled:
         iftable = coordinator.data.get("ifTable", {}) or {}
@@ -81,42 +83,26 @@ async def async_setup_entry(hass, entry, async_add_entities):
         # but bandwidth sensors should not be auto-created for those extra interfaces unless the
         # user explicitly includes them via Bandwidth Sensors/Include Rules.
         #
-        # We therefore compute a vendor-eligible ifIndex set here (mirroring switch.py vendor logic,
-        # but intentionally NOT honoring interface include rules).
-        allowed_if_indexes: set[int] = set()
-
-        ip_index = client.cache.get("ipIndex", {}) or {}
-        ip_mask = client.cache.get("ipMask", {}) or {}
+        # Vendor eligibility is therefore checked here first (mirroring switch.py vendor logic,
+        # but intentionally NOT honoring interface include rules), then the bandwidth
+        # include/exclude rules, in a single pass over the ifTable.
         disabled_vendor_filter_ids = set(entry.options.get("disabled_vendor_filter_rule_ids", []) or [])
-
-        manufacturer_l = (client.cache.get("manufacturer") or "").lower()
-        sys_descr_l = (client.cache.get("sysDescr") or "").lower()
-        is_cisco_sg = manufacturer_l.startswith("sg") and sys_descr_l.startswith("sg")
-        is_junos = ("juniper" in manufacturer_l) or ("junos" in sys_descr_l) or ("ex2200" in sys_descr_l)
-
-        def _ip_for_index(if_index: int) -> str | None:
-            # Match switch.py behavior: return "<ip>/<maskbits>" if present for this ifIndex
-            try:
-                for ip, idx in (ip_index or {}).items():
-                    if int(idx) == int(if_index):
-                        mask = str((ip_mask or {}).get(ip) or "")
-                        bits = 0
-                        if mask:
-                            # Convert dotted quad to mask bits
-                            parts = [int(p) for p in mask.split(".") if p.isdigit()]
-                            if len(parts) == 4:
-                                bits = sum(bin(p).count("1") for p in parts)
-                        return f"{ip}/{bits}" if bits else str(ip)
-            except Exception:
-                return None
-            return None
-
-        for idx_i, row in (iftable or {}).items():
-            try:
-                idx_i = int(idx_i)
-            except Exception:
-                continue
-
+        vendor_family = detect_vendor_family(client.cache.get("manufacturer"), client.cache.get("sysDescr"))
+
+        include_starts = clean_match_list(entry.options.get(CONF_BW_INCLUDE_STARTS_WITH))
+        include_contains = clean_match_list(entry.options.get(CONF_BW_INCLUDE_CONTAINS))
+        include_ends = clean_match_list(entry.options.get(CONF_BW_INCLUDE_ENDS_WITH))
+        exclude_starts = clean_match_list(entry.options.get(CONF_BW_EXCLUDE_STARTS_WITH))
+        exclude_contains = clean_match_list(entry.options.get(CONF_BW_EXCLUDE_CONTAINS))
+        exclude_ends = clean_match_list(entry.options.get(CONF_BW_EXCLUDE_ENDS_WITH))
+        any_include_rules = bool(include_starts or include_contains or include_ends)
+        any_exclude_rules = bool(exclude_starts or exclude_contains or exclude_ends)
+        include_match = name_matcher(include_starts, include_contains, include_ends)
+        exclude_match = name_matcher(exclude_starts, exclude_contains, exclude_ends)
+
+        # The client keys ifTable by integer ifIndex, so indexes are unique and
+        # need no coercion or de-duplication here.
+        for idx_i, row in iftable.items():
             raw_name = str(row.get("name") or row.get("descr") or f"if{idx_i}").strip()
             alias = str(row.get("alias") or "")
             if not raw_name:
@@ -126,101 +112,36 @@ async def async_setup_entry(hass, entry, async_add_entities):
             if raw_name.upper() == "CPU":
                 continue
 
-            lower = raw_name.lower()
-            ip_str = _ip_for_index(idx_i)
+            # Addresses are attached to their ifTable rows by the client.
+            has_ip = bool(row.get("ipv4"))
 
             # Mirror switch.py PortChannel gating (avoid pointless Po/Port-Channel entities/sensors)
-            is_port_channel = lower.startswith("po") or lower.startswith("port-channel") or lower.startswith("link aggregate")
-            if is_port_channel and not (ip_str or alias):
+            if is_port_channel(raw_name.lower()) and not (has_ip or alias):
                 continue
 
-            admin = row.get("admin")
-            oper = row.get("oper")
-            has_ip = bool(ip_str)
-            include = True  # default for unknown vendors
-
-            if is_cisco_sg:
-                enable_physical = "cisco_sg_physical_fa_gi" not in disabled_vendor_filter_ids
-                enable_vlan = "cisco_sg_vlan_admin_or_oper" not in disabled_vendor_filter_ids
-                enable_has_ip = "cisco_sg_other_has_ip" not in disabled_vendor_filter_ids
-                include = False
-
-                if enable_physical and (lower.startswith("fa") or lower.startswith("gi")):
-                    include = True
-                elif enable_vlan and lower.startswith("vlan"):
-                    if oper == 1 or admin == 2:
-                        include = True
-                elif enable_has_ip and has_ip:
-                    include = True
-
-            elif is_junos:
-                enable_physical = "junos_physical_ge" not in disabled_vendor_filter_ids
-                enable_l3_subif = "junos_l3_subif_has_ip" not in disabled_vendor_filter_ids
-                enable_vlan = "junos_vlan_admin_or_oper" not in disabled_vendor_filter_ids
-                enable_has_ip = "junos_other_has_ip" not in disabled_vendor_filter_ids
-                include = False
-
-                if enable_physical and lower.startswith("ge-") and "." not in raw_name:
-                    include = True
-                elif enable_l3_subif and lower.startswith("ge-") and "." in raw_name:
-                    try:
-                        _base, sub = raw_name.split(".", 1)
-                        if sub != "0" and has_ip:
-                            include = True
-                    except Exception:
-                        pass
-                elif enable_vlan and lower.startswith("vlan"):
-                    if oper == 1 or admin == 2:
-                        include = True
-                elif enable_has_ip and has_ip:
-                    include = True
-
-            if include:
-                allowed_if_indexes.add(idx_i)
-
-        def _clean_list(key: str) -> list[str]:
-            return [str(s).strip().lower() for s in (entry.options.get(key, []) or []) if str(s).strip()]
-
-        include_starts = _clean_list(CONF_BW_INCLUDE_STARTS_WITH)
-        include_contains = _clean_list(CONF_BW_INCLUDE_CONTAINS)
-        include_ends = _clean_list(CONF_BW_INCLUDE_ENDS_WITH)
-        exclude_starts = _clean_list(CONF_BW_EXCLUDE_STARTS_WITH)
-        exclude_contains = _clean_list(CONF_BW_EXCLUDE_CONTAINS)
-        exclude_ends = _clean_list(CONF_BW_EXCLUDE_ENDS_WITH)
-
-        def _matches_any(name_l: str, starts: list[str], contains: list[str], ends: list[str]) -> bool:
-            return (
-                any(name_l.startswith(x) for x in starts)
-                or any(x in name_l for x in contains)
-                or any(name_l.endswith(x) for x in ends)
-            )
-
-        selected_indexes: list[int] = []
-        for if_index, row in iftable.items():
-            try:
-                idx_i = int(if_index)
-            except Exception:
-                continue
-            if idx_i not in allowed_if_indexes:
+            if not vendor_filter_allows(
+                vendor_family,
+                raw_name,
+                row.get("admin"),
+                row.get("oper"),
+                has_ip,
+                disabled_vendor_filter_ids,
+            ):
                 continue
 
-            raw_name = str(row.get("name") or "").strip()
-            if not raw_name:
-                continue
-            nl = raw_name.lower()
-            include_hit = _matches_any(nl, include_starts, include_contains, include_ends)
-            exclude_hit = _matches_any(nl, exclude_starts, exclude_contains, exclude_ends)
-
-            if (include_starts or include_contains or include_ends) and not include_hit:
-                continue
-            if exclude_hit:
+            # Bandwidth rules match on ifName only.
+            if_name = str(row.get("name") or "").strip()
+            if not if_name:
                 continue
+            if any_include_rules or any_exclude_rules:
+                nl = if_name.lower()
+                if any_include_rules and not include_match(nl):
+                    continue
+                if any_exclude_rules and exclude_match(nl):
+                    continue
 
-            selected_indexes.append(idx_i)
-
-        for idx_i in selected_indexes:
             base = f"{entry.entry_id}-bw-{idx_i}"
-            bw_entities.extend(
+            entities.extend(
                 [
                     BandwidthRateSensor(coordinator, entry, idx_i, "rx", device_info, host_label),
                     BandwidthRateSensor(coordinator, entry, idx_i, "tx", device_info, host_label),
@@ -255,6 +176,10 @@ async def async_setup_entry(hass, entry, async_add_entities):
         "_rx_bytes_total",
         "_tx_bytes_total",
     )
+    # Built once here rather than per registry entry in the loop below.
+    bw_uid_prefix = f"{entry.entry_id}-bw-"
+    bad_name_prefix = f"sensor.{device_slug}_"
+    double_prefix = f"sensor.{device_slug}_{device_slug}_"
     for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
         if ent.domain != "sensor":
             continue
@@ -263,7 +188,7 @@ async def async_setup_entry(hass, entry, async_add_entities):
         eid = ent.entity_id or ""
 
         # Primary (current) bandwidth sensors are identified by unique_id prefix.
-        is_bw_uid = uid.startswith(f"{entry.entry_id}-bw-")
+        is_bw_uid = uid.startswith(bw_uid_prefix)
 
         # Legacy bandwidth sensors may have different unique_id patterns; detect by entity_id suffix.
         is_bw_legacy_eid = eid.endswith(legacy_suffixes)
@@ -271,8 +196,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
         if not (is_bw_uid or is_bw_legacy_eid):
             continue
 
-        legacy_bad_name = device_slug and (not eid.startswith(f"sensor.{device_slug}_"))
-        legacy_double_prefix = device_slug and eid.startswith(f"sensor.{device_slug}_{device_slug}_")
+        legacy_bad_name = device_slug and (not eid.startswith(bad_name_prefix))
+        legacy_double_prefix = device_slug and eid.startswith(double_prefix)
 
         # If the entity_id naming is wrong, remove so HA can recreate it with the corrected object_id.
         if legacy_bad_name or legacy_double_prefix:
@@ -288,20 +213,18 @@ async def async_setup_entry(hass, entry, async_add_entities):
             if not bw_enabled:
                 ent_reg.async_remove(eid)
 
-
-    entities.extend(bw_entities)
-
     async_add_entities(entities)
 
 
 class SimpleTextSensor(CoordinatorEntity, SensorEntity):
+    __slots__ = ("_key", "_value")
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def __init__(self, coordinator, entry, key, value, device_info: DeviceInfo, hostname: str):
         super().__init__(coordinator)
         self._key = key
         self._value = value
-        self._hostname = hostname
         self._attr_unique_id = f"{entry.entry_id}-{key}"
         # Include hostname so entity_id becomes e.g. sensor.switch1_firmware_revision
         self._attr_name = f"{hostname} {SENSOR_TYPES[key]}"
@@ -335,57 +258,86 @@ class SimpleTextSensor(CoordinatorEntity, SensorEntity):
 
 
 class _BandwidthBase(CoordinatorEntity, SensorEntity):
+    __slots__ = ("_if_index", "_direction", "_host_label", "_value_key", "_static_attrs", "_present")
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_has_entity_name = True
+    _name_suffix = ""
+    _kind = ""
 
     def __init__(self, coordinator, entry, if_index: int, direction: str, device_info: DeviceInfo, host_label: str):
         super().__init__(coordinator)
-        self._entry = entry
         self._if_index = int(if_index)
         self._direction = direction  # "rx" or "tx"
-        self._device_info = device_info
         self._host_label = host_label
-
-    @property
-    def device_info(self):
-        return self._device_info
-
-    @property
-    def extra_state_attributes(self):
-        return {
+        # Static per entity: set once instead of rebuilding on every state read.
+        # The static attributes are the template for each attribute refresh.
+        self._attr_device_info = device_info
+        self._static_attrs = {
             "if_index": self._if_index,
             "direction": self._direction,
+            "kind": self._kind,
         }
+        self._refresh_attrs()
 
-    def _if_name(self) -> str:
-        row = self.coordinator.data.get("ifTable", {}).get(self._if_index, {}) or {}
-        return str(row.get("name") or f"ifIndex {self._if_index}").strip()
+    @property
+    def available(self) -> bool:
+        # Requires the ifIndex to still be present in ifTable.
+        return super().available and self._present
+
+    def _refresh_attrs(self) -> None:
+        """Rebuild the name, presence and attributes from the coordinator data.
+
+        Done once per coordinator update rather than on every state read.
+        """
+        if_row = self.coordinator.data.get("ifTable", EMPTY_DICT).get(self._if_index)
+        self._present = if_row is not None
+        if_name = str((if_row or EMPTY_DICT).get("name") or f"ifIndex {self._if_index}").strip()
+        label = "RX" if self._direction == "rx" else "TX"
+        # Include the device label to ensure entity_id uniqueness matches other entities
+        # (e.g. sensor.switch_study_gi1_0_1_rx_throughput)
+        self._attr_name = f"{self._host_label} {if_name} {label} {self._name_suffix}"
+
+        attrs = self._static_attrs.copy()
+        # One lookup per key; the client always fills both fields.
+        row = self._bw_row()
+        use_hc = row.get("use_hc")
+        if use_hc is not None:
+            attrs["use_hc"] = bool(use_hc)
+        ts = row.get("ts")
+        if ts is not None:
+            try:
+                attrs["sample_ts"] = float(ts)
+            except Exception:
+                pass
+        self._attr_extra_state_attributes = attrs
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._refresh_attrs()
+        super()._handle_coordinator_update()
 
     def _bw_row(self) -> dict:
-        return (self.coordinator.data.get("bandwidth", {}) or {}).get(self._if_index, {}) or {}
+        return (self.coordinator.data.get("bandwidth") or EMPTY_DICT).get(self._if_index) or EMPTY_DICT
 
 
 class BandwidthRateSensor(_BandwidthBase):
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.DATA_RATE
     _attr_native_unit_of_measurement = "bit/s"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _name_suffix = "Throughput"
+    _kind = "throughput"
 
     def __init__(self, coordinator, entry, if_index: int, direction: str, device_info: DeviceInfo, host_label: str):
         super().__init__(coordinator, entry, if_index, direction, device_info, host_label)
         self._attr_unique_id = f"{entry.entry_id}-bw-{self._if_index}-{direction}_bps"
-
-    @property
-    def name(self) -> str:
-        label = "RX" if self._direction == "rx" else "TX"
-        # Include the device label to ensure entity_id uniqueness matches other entities
-        # (e.g. sensor.switch_study_gi1_0_1_rx_throughput)
-        return f"{self._host_label} {self._if_name()} {label} Throughput"
+        self._value_key = f"{direction}_bps"
 
     @property
     def native_value(self):
-        row = self._bw_row()
-        key = "rx_bps" if self._direction == "rx" else "tx_bps"
-        val = row.get(key)
+        val = self._bw_row().get(self._value_key)
         if val is None:
             return None
         try:
@@ -393,57 +345,27 @@ class BandwidthRateSensor(_BandwidthBase):
         except Exception:
             return None
 
-    @property
-    def extra_state_attributes(self):
-        attrs = dict(super().extra_state_attributes)
-        attrs["kind"] = "throughput"
-        row = self._bw_row()
-        if "use_hc" in row:
-            attrs["use_hc"] = bool(row.get("use_hc"))
-        if "ts" in row:
-            try:
-                attrs["sample_ts"] = float(row.get("ts"))
-            except Exception:
-                pass
-        return attrs
-
 
 class BandwidthTotalSensor(_BandwidthBase):
+    __slots__ = ()
+
     _attr_device_class = SensorDeviceClass.DATA_SIZE
     _attr_native_unit_of_measurement = "B"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _name_suffix = "Total"
+    _kind = "total"
 
     def __init__(self, coordinator, entry, if_index: int, direction: str, device_info: DeviceInfo, host_label: str):
         super().__init__(coordinator, entry, if_index, direction, device_info, host_label)
         self._attr_unique_id = f"{entry.entry_id}-bw-{self._if_index}-{direction}_bytes_total"
-
-    @property
-    def name(self) -> str:
-        label = "RX" if self._direction == "rx" else "TX"
-        return f"{self._host_label} {self._if_name()} {label} Total"
+        self._value_key = f"{direction}_octets"
 
     @property
     def native_value(self):
-        row = self._bw_row()
-        key = "rx_octets" if self._direction == "rx" else "tx_octets"
-        val = row.get(key)
+        val = self._bw_row().get(self._value_key)
         if val is None:
             return None
         try:
             return int(val)
         except Exception:
             return None
-
-    @property
-    def extra_state_attributes(self):
-        attrs = dict(super().extra_state_attributes)
-        attrs["kind"] = "total"
-        row = self._bw_row()
-        if "use_hc" in row:
-            attrs["use_hc"] = bool(row.get("use_hc"))
-        if "ts" in row:
-            try:
-                attrs["sample_ts"] = float(row.get("ts"))
-            except Exception:
-                pass
-        return attrs
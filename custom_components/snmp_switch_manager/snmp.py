@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import re
+import socket
+import struct
+import sys
 import time
 import logging
-from typing import Any, Dict, Optional, Iterable, Tuple, List
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Iterable, Tuple, List
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from pyasn1.type import univ
+from pyasn1.type.base import Asn1Type
+from pysnmp.proto import errind
 
 from .snmp_compat import (
     CommunityData,
@@ -16,6 +25,7 @@ from .snmp_compat import (
     ObjectIdentity,
     get_cmd,
     next_cmd,
+    bulk_cmd,
     set_cmd,
     OctetString,
     Integer,
@@ -34,7 +44,8 @@ from .const import (
     OID_ifAlias,
     OID_ifSpeed,
     OID_ifHighSpeed,
-    OID_ipAdEntAddr,
+    OID_dot1dBasePortIfIndex,
+    OID_dot1qPvid,
     OID_ipAdEntIfIndex,
     OID_ipAdEntNetMask,
     OID_entPhysicalModelName,
@@ -56,7 +67,13 @@ from .const import (
     CONF_BW_EXCLUDE_ENDS_WITH,
     CONF_BANDWIDTH_POLL_INTERVAL,
     DEFAULT_BANDWIDTH_POLL_INTERVAL,
+    DEFAULT_MAX_REPETITIONS,
+    MIN_MAX_REPETITIONS,
+    MAX_MAX_REPETITIONS,
+    DEFAULT_SNMP_TIMEOUT,
+    DEFAULT_SNMP_RETRIES,
 )
+from .helpers import clean_match_list, mask_to_prefix, name_matcher
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -69,18 +86,161 @@ OID_ospfIfIpAddress = "1.3.6.1.2.1.14.8.1.1"
 # we read column 9 (.9) because any column shares the same index layout
 OID_routeCol = "1.3.6.1.2.1.4.24.7.1.9"
 
+# An IPv4 destination inside a route instance: "1.4.<a>.<b>.<c>.<d>.<bits>"
+# (InetAddressType ipv4, length 4, address, prefix length), followed by at
+# least one more sub-identifier. Zero-width so overlapping candidates are
+# all tried, in order.
+_ROUTE_DEST_RE = re.compile(r"(?<![^.])(?=1\.4\.(\d+)\.(\d+)\.(\d+)\.(\d+)\.(\d+)\.\d)")
+
+# Dotted netmask for every prefix length 0..32.
+_MASK_LUT: Tuple[str, ...] = tuple(
+    socket.inet_ntoa(struct.pack("!I", (0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF)) for bits in range(33)
+)
+
+# Offsets of the instance suffix within walked OIDs (base + ".").
+_SUFFIX_ipAdEntIfIndex = len(OID_ipAdEntIfIndex) + 1
+_SUFFIX_ipAddressIfIndex = len(OID_ipAddressIfIndex) + 1
+_SUFFIX_ospfIfIpAddress = len(OID_ospfIfIpAddress) + 1
+_SUFFIX_routeCol = len(OID_routeCol) + 1
+
+
+# ---------- value decoding -------------
+
+def _octets_to_text(val: Any) -> str:
+    """Decode an OctetString column (ifDescr/ifName/ifAlias) to text.
+
+    Reads the raw octets directly instead of going through pysnmp's
+    formatter. UTF-8 is tried first; latin-1 (pysnmp's own default encoding)
+    is the fallback so aliases written by this integration still round-trip.
+    """
+    if not isinstance(val, univ.OctetString):
+        return str(val)
+    raw = val.asOctets()
+    try:
+        return raw.decode("utf-8")
+    except UnicodeDecodeError:
+        return raw.decode("latin-1")
+
+
+def _interned_text(val: Any) -> str:
+    """_octets_to_text for low-cardinality columns (names, descriptions).
+
+    Interning gives every re-walk the very same string objects, so the
+    coordinator's old-vs-new data comparison short-circuits on identity
+    and repeated values share one copy.
+    """
+    return sys.intern(_octets_to_text(val))
+
+
+def _row_index(oid: str) -> int:
+    """Last sub-identifier of a column instance (the row index)."""
+    return int(oid.rsplit(".", 1)[1])
+
+
+def _as_int(val: Any) -> Optional[int]:
+    """Integer value of a varbind, or None for noSuch*/endOfMib sentinels."""
+    return int(val) if isinstance(val, univ.Integer) else None
+
 
 # ---------- low-level sync helpers offloaded by compat -------------
 
+# Upper bound for a single request/response exchange. pysnmp applies its own
+# timeout/retries per target; this only guarantees that a request which never
+# completes is cancelled instead of stalling the whole poll.
+_REQUEST_DEADLINE = 10.0
+
+# Ceiling for the adaptively raised per-request timeout; with the default
+# retries this still fits inside _REQUEST_DEADLINE.
+_MAX_SNMP_TIMEOUT = 3.0
+
+# Walks of independent tables run concurrently (interfaces + bridge, the four
+# IPv4 sources), so cap the PDUs outstanding against any one device rather
+# than letting a single poll burst at a small switch's SNMP agent. Slots are
+# keyed by the agent address, not the target object, so a target swapped
+# mid-poll (raised timeout, re-resolve) shares them with its replacement.
+# An entry is [semaphore, users] and is dropped once nobody uses it.
+_MAX_IN_FLIGHT = 4
+_IN_FLIGHT: Dict[Any, list] = {}
+
+
+# Weak agents time out or answer tooBig on large GETBULK max-repetitions
+# values, so a device's working value is learned and remembered per
+# (host, port) for clients created later (e.g. after an options reload), as
+# (configured ceiling, learned value). Changing the configured ceiling
+# discards what was learned under the old one.
+_MAX_REPS_CACHE: Dict[Tuple[str, int], Tuple[int, int]] = {}
+# A timeout may just be a lost packet: it only lowers the ceiling once walks
+# had to shrink on timeouts in this many consecutive polls (tooBig always does).
+_REPS_TIMEOUT_POLLS = 3
+_ERR_STATUS_TOO_BIG = 1
+# Safety net against agents that never end a column.
+_MAX_WALK_ROWS = 10000
+
+# Rough number of varbinds requested per GETBULK when several columns are
+# walked side by side.
+_BULK_VARBINDS = 50
+
+# Prepared ObjectTypes for OIDs that are requested over and over (system
+# scalars, column roots, per-port counters). pysnmp resolves an ObjectType
+# once and then reuses it, so keeping them avoids redoing that per request.
+# Walk cursors are not cached since each one is used only once.
+_OID_CACHE: Dict[str, ObjectType] = {}
+_OID_CACHE_MAX = 4096
+
+
+def _oid(oid: str) -> ObjectType:
+    """Return a (shared) ObjectType for a fixed OID."""
+    obj = _OID_CACHE.get(oid)
+    if obj is None:
+        if len(_OID_CACHE) >= _OID_CACHE_MAX:
+            _OID_CACHE.clear()
+        obj = _OID_CACHE[oid] = ObjectType(ObjectIdentity(oid))
+    return obj
+
+
+async def _bounded(target, coro):
+    """Await an SNMP command, reporting an overrun as a request timeout.
+
+    At most _MAX_IN_FLIGHT requests are outstanding per agent address; the
+    deadline only starts once the request is actually sent.
+    """
+    key = _slot_key(target)
+    entry = _IN_FLIGHT.get(key)
+    if entry is None:
+        entry = _IN_FLIGHT[key] = [asyncio.Semaphore(_MAX_IN_FLIGHT), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            return await asyncio.wait_for(coro, _REQUEST_DEADLINE)
+    except asyncio.TimeoutError:
+        return errind.requestTimedOut, 0, 0, ()
+    finally:
+        entry[1] -= 1
+        if not entry[1] and _IN_FLIGHT.get(key) is entry:
+            del _IN_FLIGHT[key]
+        # No-op once awaited; avoids a "never awaited" warning if we were
+        # cancelled while queued for a slot.
+        coro.close()
+
+
+def _slot_key(target) -> Any:
+    """(address, port) the target sends to; falls back to the target itself."""
+    return (
+        getattr(target, "transport_address", None)  # PySNMP >= 7
+        or getattr(target, "transportAddr", None)  # legacy hlapi
+        or target
+    )
+
+
 async def _do_get_one(engine, community, target, context, oid: str) -> Optional[str]:
-    err_ind, err_stat, err_idx, vbs = await get_cmd(
+    err_ind, err_stat, err_idx, vbs = await _bounded(target, get_cmd(
         engine,
         community,
         target,
         context,
-        ObjectType(ObjectIdentity(oid)),
+        _oid(oid),
         lookupMib=False,  # <<< prevent FS MIB access
-    )
+    ))
     if err_ind or err_stat:
         return None
     for vb in vbs:
@@ -88,13 +248,67 @@ async def _do_get_one(engine, community, target, context, oid: str) -> Optional[
     return None
 
 
-async def _do_get_many(engine, community, target, context, oids: list[str]) -> Dict[str, Optional[str]]:
+async def _do_get_scalars(engine, community, target, context, oids: list[str]) -> list[Optional[str]]:
+    """Fetch a handful of scalars in a single GET PDU.
+
+    Values are returned by position, with the same formatting as
+    _do_get_one. If the agent rejects the combined request (e.g. SNMPv1
+    noSuchName for one of the OIDs) we fall back to one GET per OID.
+    """
+    if not oids:
+        return []
+
+    err_ind, err_stat, err_idx, vbs = await _bounded(target, get_cmd(
+        engine,
+        community,
+        target,
+        context,
+        *[_oid(oid) for oid in oids],
+        lookupMib=False,  # prevent FS MIB access
+    ))
+    if not err_ind and not err_stat and len(vbs) == len(oids):
+        return [str(vb[1]) for vb in vbs]
+    if isinstance(err_ind, errind.RequestTimedOut):
+        # The agent is not answering at all; retrying OID by OID would only
+        # multiply the timeout.
+        return [None] * len(oids)
+
+    return [await _do_get_one(engine, community, target, context, oid) for oid in oids]
+
+
+def _varbind_text(val: Any) -> Optional[str]:
+    """Printable value of a varbind, or None for noSuch*/endOfMib sentinels."""
+    # Counters/gauges/timeticks: skip the ASN.1 formatter entirely.
+    if isinstance(val, univ.Integer):
+        return str(int(val))
+    try:
+        s = val.prettyPrint() if isinstance(val, Asn1Type) else str(val)
+    except Exception:
+        s = str(val)
+    if not s:
+        return None
+    s_low = s.lower()
+    if "no such" in s_low or "nosuch" in s_low or "endofmib" in s_low:
+        return None
+    return s
+
+
+async def _do_get_many(
+    engine,
+    community,
+    target,
+    context,
+    oids: list[str],
+    convert: Callable[[Any], Any] = _varbind_text,
+) -> Dict[str, Any]:
     """Fetch many OIDs, chunked to avoid oversized PDUs.
 
-    Returns a mapping of oid string -> value string (or None).
+    Returns a mapping of oid string -> converted value (or None). By default
+    values are printable strings; numeric callers pass ``convert=_as_int`` to
+    get ints straight from the varbinds.
     """
 
-    out: Dict[str, Optional[str]] = {oid: None for oid in oids}
+    out: Dict[str, Any] = {oid: None for oid in oids}
     if not oids:
         return out
 
@@ -108,19 +322,20 @@ async def _do_get_many(engine, community, target, context, oids: list[str]) -> D
         if not chunk:
             return
 
-        var_binds = [ObjectType(ObjectIdentity(oid)) for oid in chunk]
-        err_ind, err_stat, err_idx, vbs = await get_cmd(
+        var_binds = [_oid(oid) for oid in chunk]
+        err_ind, err_stat, err_idx, vbs = await _bounded(target, get_cmd(
             engine,
             community,
             target,
             context,
             *var_binds,
             lookupMib=False,  # prevent FS MIB access
-        )
+        ))
 
         if err_ind or err_stat:
-            # Split & retry (down to per-OID).
-            if len(chunk) == 1:
+            # Split & retry (down to per-OID). A timeout is not a PDU-size
+            # problem, so splitting would only multiply the wait.
+            if len(chunk) == 1 or isinstance(err_ind, errind.RequestTimedOut):
                 return
             mid = max(1, len(chunk) // 2)
             await _fetch_chunk(chunk[:mid])
@@ -128,18 +343,7 @@ async def _do_get_many(engine, community, target, context, oids: list[str]) -> D
             return
 
         for oid_obj, val in vbs:
-            try:
-                s = val.prettyPrint() if hasattr(val, "prettyPrint") else str(val)
-            except Exception:
-                s = str(val)
-            if not s:
-                out[str(oid_obj)] = None
-                continue
-            s_low = s.lower()
-            if "no such" in s_low or "nosuch" in s_low or "endofmib" in s_low:
-                out[str(oid_obj)] = None
-                continue
-            out[str(oid_obj)] = s
+            out[str(oid_obj)] = convert(val)
 
     # Keep requests reasonably sized; we'll split further on vendor errors.
     CHUNK = 20
@@ -153,17 +357,18 @@ async def _do_next_walk(
     engine, community, target, context, base_oid: str
 ) -> Iterable[Tuple[str, Any]]:
     current_oid = base_oid
+    prefix = base_oid + "."
     seen: set[str] = set()
     while True:
-        err_ind, err_stat, err_idx, vbs = await next_cmd(
+        err_ind, err_stat, err_idx, vbs = await _bounded(target, next_cmd(
             engine,
             community,
             target,
             context,
-            ObjectType(ObjectIdentity(current_oid)),
+            _oid(current_oid) if current_oid == base_oid else ObjectType(ObjectIdentity(current_oid)),
             lexicographicMode=False,
             lookupMib=False,  # <<< prevent FS MIB access
-        )
+        ))
         if err_ind or err_stat or not vbs:
             break
 
@@ -171,7 +376,7 @@ async def _do_next_walk(
         for vb in vbs:
             oid_obj, val = vb
             oid_str = str(oid_obj)
-            if not (oid_str == base_oid or oid_str.startswith(base_oid + ".")):
+            if not (oid_str == base_oid or oid_str.startswith(prefix)):
                 return
             if oid_str in seen:
                 return
@@ -184,47 +389,217 @@ async def _do_next_walk(
             break
 
 
-async def _do_set_alias(
-    engine, community, target, context, if_index: int, alias: str
-) -> bool:
-    err_ind, err_stat, err_idx, _ = await set_cmd(
-        engine,
-        community,
-        target,
-        context,
-        ObjectType(ObjectIdentity(f"{OID_ifAlias}.{if_index}"), OctetString(alias)),
-        lookupMib=False,  # <<< prevent FS MIB access
-    )
-    return (not err_ind) and (not err_stat)
+async def _do_bulk_walk(
+    engine,
+    community,
+    target,
+    context,
+    base_oids: list[str],
+    max_reps: int = 25,
+    on_shrink: Optional[Callable[[int, bool], None]] = None,
+    on_timeout: Optional[Callable[[], None]] = None,
+    on_abort: Optional[Callable[[bool], None]] = None,
+) -> AsyncIterator[Tuple[str, str, Any]]:
+    """Walk one or more table columns side by side using GETBULK.
+
+    Yields (base_oid, oid, value). Every PDU carries one varbind per
+    still-active column; a column is finished as soon as the agent answers
+    with an OID outside its subtree (or repeats one), or after
+    _MAX_WALK_ROWS rows.
+
+    If a request times out or the response is too big, it is retried once
+    with half the repetitions; on_shrink is told about the smaller value and
+    whether the agent reported tooBig (False: it timed out).
+    on_timeout is called for every request that timed out. If the walk
+    stops on an error rather than at the end of the subtree, on_abort is
+    called with whether the last request timed out.
+    """
+    cursors: Dict[str, str] = {base: base for base in base_oids}
+    prefixes: Dict[str, str] = {base: base + "." for base in base_oids}
+    rows: Dict[str, int] = dict.fromkeys(base_oids, 0)
+    seen: set[str] = set()
+    retried = False
+    while cursors:
+        active = list(cursors)
+        err_ind, err_stat, err_idx, vbs = await _bounded(target, bulk_cmd(
+            engine,
+            community,
+            target,
+            context,
+            0,
+            max_reps,
+            *[
+                _oid(base) if cursors[base] == base else ObjectType(ObjectIdentity(cursors[base]))
+                for base in active
+            ],
+            lookupMib=False,  # <<< prevent FS MIB access
+        ))
+        if err_ind or err_stat or not vbs:
+            if on_timeout is not None and isinstance(err_ind, errind.RequestTimedOut):
+                on_timeout()
+            timed_out = isinstance(err_ind, errind.RequestTimedOut)
+            too_big = isinstance(err_ind, errind.TooBig) or bool(
+                err_stat and int(err_stat) == _ERR_STATUS_TOO_BIG
+            )
+            if (too_big or timed_out) and not retried and max_reps > MIN_MAX_REPETITIONS:
+                retried = True
+                max_reps = max(MIN_MAX_REPETITIONS, max_reps // 2)
+                if on_shrink is not None:
+                    on_shrink(max_reps, too_big)
+                continue
+            if on_abort is not None:
+                on_abort(timed_out)
+            return
+
+        # Responses are row-major: one varbind per requested column, repeated.
+        width = len(active)
+        finished: set[str] = set()
+        advanced = False
+        for pos, (oid_obj, val) in enumerate(vbs):
+            base = active[pos % width]
+            if base in finished:
+                continue
+            oid_str = str(oid_obj)
+            if not oid_str.startswith(prefixes[base]) or oid_str in seen:
+                finished.add(base)
+                continue
+            seen.add(oid_str)
+            cursors[base] = oid_str
+            advanced = True
+            yield base, oid_str, val
+            rows[base] += 1
+            if rows[base] >= _MAX_WALK_ROWS:
+                _LOGGER.debug("Stopping walk of %s after %s rows", base, rows[base])
+                finished.add(base)
+
+        for base in finished:
+            cursors.pop(base, None)
+        if not advanced and not finished:
+            return
+
 
+# ifTable fields that can be written, mapped to (column OID, value type).
+_WRITABLE_COLUMNS = {
+    "alias": (OID_ifAlias, OctetString),
+    "admin": (OID_ifAdminStatus, Integer),
+}
 
-async def _do_set_admin_status(
-    engine, community, target, context, if_index: int, value: int
-) -> bool:
-    err_ind, err_stat, err_idx, _ = await set_cmd(
+
+async def _do_set(engine, community, target, context, ops: list[tuple[str, Any]]) -> bool:
+    """Write one or more (oid, value) pairs in a single SET PDU."""
+    err_ind, err_stat, err_idx, _ = await _bounded(target, set_cmd(
         engine,
         community,
         target,
         context,
-        ObjectType(
-            ObjectIdentity(f"{OID_ifAdminStatus}.{if_index}"),
-            Integer(value),
-        ),
+        *[ObjectType(ObjectIdentity(oid), val) for oid, val in ops],
         lookupMib=False,  # <<< prevent FS MIB access
-    )
+    ))
     return (not err_ind) and (not err_stat)
 
 
+# ---------- engine ----------
+
+# One SnmpEngine is shared by every client (and config-flow probe): it is
+# fully asyncio-driven and can serve any number of targets, so only the
+# first caller pays for building it in the executor.
+_ENGINE: Optional[SnmpEngine] = None
+_ENGINE_LOCK = asyncio.Lock()
+
+# Transport targets are plain address/timeout descriptors (the socket lives in
+# the shared engine), so one per (host, port, timeout, retries) is enough.
+# Creating one resolves the host name, which we only want to redo when the
+# device stops answering (its address may have changed).
+_TRANSPORT_CACHE: Dict[Tuple[str, int, float, int], UdpTransportTarget] = {}
+
+
+def _build_engine_with_minimal_preload() -> SnmpEngine:
+    eng = SnmpEngine()
+    try:
+        mib_builder = eng.getMibBuilder()
+        try:
+            mib_builder.setMibSources()  # clear FS sources
+        except TypeError:
+            pass
+        try:
+            mib_builder.loadModules("SNMPv2-SMI", "SNMPv2-MIB", "__SNMPv2-MIB", "PYSNMP-SOURCE-MIB")
+        except Exception:
+            pass
+    except Exception:
+        pass
+    return eng
+
+
+async def _get_engine(hass: HomeAssistant) -> SnmpEngine:
+    global _ENGINE
+    if _ENGINE is None:
+        async with _ENGINE_LOCK:
+            if _ENGINE is None:
+                # MIB preload touches the filesystem, so build off the loop once.
+                _ENGINE = await hass.async_add_executor_job(_build_engine_with_minimal_preload)
+    return _ENGINE
+
+
+async def _get_target(
+    host: str,
+    port: int,
+    timeout: float = DEFAULT_SNMP_TIMEOUT,
+    retries: int = DEFAULT_SNMP_RETRIES,
+) -> UdpTransportTarget:
+    key = (host, port, timeout, retries)
+    target = _TRANSPORT_CACHE.get(key)
+    if target is None:
+        target = await UdpTransportTarget.create((host, port), timeout=timeout, retries=retries)
+        _TRANSPORT_CACHE[key] = target
+    return target
+
+
+def _release_target(host: str, port: int, timeout: float, retries: int, target: Any) -> None:
+    """Drop a cached transport if it is still current.
+
+    Request slots are not tied to the transport: they are keyed by address
+    and go away on their own once no request holds them.
+    """
+    key = (host, port, timeout, retries)
+    if target is not None and _TRANSPORT_CACHE.get(key) is target:
+        _TRANSPORT_CACHE.pop(key, None)
+
+
 # ---------- client ----------
 
+# Generic (manufacturer, model hint, firmware) derived from sysDescr and the
+# entPhysicalModelName walk, per (host, sysDescr). A reload of the same device
+# skips the walk; a firmware upgrade changes sysDescr and so misses the cache.
+# Vendor-specific and custom-OID overrides are still applied on every init.
+_SYS_PARSE_CACHE: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str], Optional[str]]] = {}
+
+# How long the walked interface/IPv4 tables are trusted before re-walking.
+_IF_TABLE_TTL = 300.0
+
 class SwitchSnmpClient:
     """SNMP client using PySNMP v7 asyncio API."""
 
-    def __init__(self, hass: HomeAssistant, host: str, community: str, port: int, custom_oids: Optional[Dict[str, str]] = None, bandwidth_options: Optional[Dict[str, Any]] = None) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        community: str,
+        port: int,
+        custom_oids: Optional[Dict[str, str]] = None,
+        bandwidth_options: Optional[Dict[str, Any]] = None,
+        timeout: float = DEFAULT_SNMP_TIMEOUT,
+        retries: int = DEFAULT_SNMP_RETRIES,
+    ) -> None:
         self.hass = hass
         self.host = host
         self.community = community
         self.port = port
+        self.timeout = float(timeout)
+        self.retries = int(retries)
+        # Set once a walk has returned data. Timeouts after that point mean a
+        # slow or lossy path rather than a dead device, so the timeout is raised.
+        self._walk_ok = False
+        self._target_timeout = self.timeout
         self.custom_oids: Dict[str, str] = dict(custom_oids or {})
 
         # Bandwidth sensor options (set by config entry options)
@@ -232,11 +607,28 @@ class SwitchSnmpClient:
         self._bw_last_poll = None  # monotonic timestamp of last bandwidth counter poll
         self._bw_use_hc: Optional[bool] = None
         self._bw_last: Dict[int, Dict[str, Any]] = {}
+        # Options only change through an entry reload (which builds a new
+        # client), so the interface rules are normalized and compiled once.
+        opts = self._bandwidth_options
+        include_starts = clean_match_list(opts.get(CONF_BW_INCLUDE_STARTS_WITH))
+        include_contains = clean_match_list(opts.get(CONF_BW_INCLUDE_CONTAINS))
+        include_ends = clean_match_list(opts.get(CONF_BW_INCLUDE_ENDS_WITH))
+        self._bw_has_include = bool(include_starts or include_contains or include_ends)
+        self._bw_include_match = name_matcher(include_starts, include_contains, include_ends)
+        exclude_starts = clean_match_list(opts.get(CONF_BW_EXCLUDE_STARTS_WITH))
+        exclude_contains = clean_match_list(opts.get(CONF_BW_EXCLUDE_CONTAINS))
+        exclude_ends = clean_match_list(opts.get(CONF_BW_EXCLUDE_ENDS_WITH))
+        self._bw_has_exclude = bool(exclude_starts or exclude_contains or exclude_ends)
+        self._bw_exclude_match = name_matcher(exclude_starts, exclude_contains, exclude_ends)
 
         self.engine = None
         self.target = None
-        self._target_args = ((host, port),)
-        self._target_kwargs = dict(timeout=1.5, retries=1)
+        self._max_reps_configured: int = DEFAULT_MAX_REPETITIONS
+        self._max_reps: int = self._learned_max_reps(DEFAULT_MAX_REPETITIONS)
+        # Smallest repetitions a walk fell back to on a timeout this poll, and
+        # the number of consecutive polls that had one.
+        self._reps_timeout_value: Optional[int] = None
+        self._reps_timeout_polls = 0
 
         self.community_data = CommunityData(community, mpModel=1)  # v2c
         self.context = ContextData()
@@ -259,6 +651,23 @@ class SwitchSnmpClient:
         self._last_uptime_poll: float = 0.0
         self._uptime_poll_interval: float = 300.0
 
+        # Interface/IPv4 state is reused for a few seconds so closely spaced
+        # refreshes (e.g. the first coordinator refresh right after
+        # async_initialize) don't walk the device again. The lock keeps
+        # concurrent callers from starting duplicate walks.
+        self._dynamic_lock = asyncio.Lock()
+        self._dynamic_ts: float = 0.0
+        self._dynamic_ttl: float = 5.0
+
+        # Between full walks only the admin/oper columns are re-walked, and
+        # the name/speed/VLAN columns and IPv4 tables are left alone.
+        # The walk interval is jittered so many devices don't re-walk at once.
+        self._full_walk_ts: float = 0.0
+        self._full_walk_ttl: float = _IF_TABLE_TTL
+        # ifIndex -> ifAdminStatus instance OID, built once per port instead
+        # of on every admin toggle.
+        self._admin_oid_cache: Dict[int, str] = {}
+
     def _custom_oid(self, key: str) -> Optional[str]:
         val = (self.custom_oids or {}).get(key)
         if not val:
@@ -271,6 +680,72 @@ class SwitchSnmpClient:
         return v
 
 
+    def set_max_repetitions(self, value: int) -> None:
+        """Set the GETBULK max-repetitions ceiling for this device."""
+        try:
+            val = int(value)
+        except Exception:
+            val = DEFAULT_MAX_REPETITIONS
+        val = min(MAX_MAX_REPETITIONS, max(MIN_MAX_REPETITIONS, val))
+        self._max_reps_configured = val
+        # A smaller value learned under the same setting still wins.
+        self._max_reps = self._learned_max_reps(val)
+
+    def _learned_max_reps(self, configured: int) -> int:
+        key = (self.host, self.port)
+        cached = _MAX_REPS_CACHE.get(key)
+        if cached is None:
+            return configured
+        if cached[0] != configured:
+            # The user changed the ceiling: start over from the new value.
+            _MAX_REPS_CACHE.pop(key, None)
+            return configured
+        return min(configured, cached[1])
+
+    def _shrink_max_reps(self, value: int, too_big: bool) -> None:
+        """A single-column walk had to halve its repetitions to value."""
+        if too_big:
+            self._lower_max_reps(value)
+        elif self._reps_timeout_value is None or value < self._reps_timeout_value:
+            self._reps_timeout_value = value
+
+    def _shrink_max_reps_columns(self, ncols: int) -> Callable[[int, bool], None]:
+        """on_shrink for a walk of ncols columns side by side.
+
+        Its repetitions are already scaled down by the column count, so the
+        shrunk value is scaled back up to a per-column ceiling; only a value
+        below the current ceiling lowers it.
+        """
+        def _on_shrink(value: int, too_big: bool) -> None:
+            self._shrink_max_reps(value * ncols, too_big)
+
+        return _on_shrink
+
+    def _lower_max_reps(self, value: int) -> None:
+        value = max(MIN_MAX_REPETITIONS, value)
+        if value < self._max_reps:
+            _LOGGER.debug("Lowering GETBULK max-repetitions for %s to %s", self.host, value)
+            self._max_reps = value
+            _MAX_REPS_CACHE[(self.host, self.port)] = (self._max_reps_configured, value)
+
+    def _settle_reps_timeouts(self) -> None:
+        """End of a poll: lower the ceiling after repeated timeout shrinks."""
+        pending = self._reps_timeout_value
+        self._reps_timeout_value = None
+        if pending is None or pending >= self._max_reps:
+            self._reps_timeout_polls = 0
+            return
+        self._reps_timeout_polls += 1
+        if self._reps_timeout_polls >= _REPS_TIMEOUT_POLLS:
+            self._reps_timeout_polls = 0
+            self._lower_max_reps(pending)
+
+    def _note_timeout(self) -> None:
+        if not self._walk_ok or self.timeout >= _MAX_SNMP_TIMEOUT:
+            return
+        self.timeout = min(_MAX_SNMP_TIMEOUT, round(self.timeout * 1.5, 1))
+        _LOGGER.debug("Raising SNMP timeout for %s to %ss", self.host, self.timeout)
+
     def set_uptime_poll_interval(self, seconds: float | int) -> None:
         """Set the sysUpTime throttling interval (seconds)."""
         try:
@@ -283,30 +758,23 @@ class SwitchSnmpClient:
         self._uptime_poll_interval = val
 
     async def _ensure_engine(self) -> None:
-        if self.engine is not None:
-            return
-
-        def _build_engine_with_minimal_preload():
-            eng = SnmpEngine()
-            try:
-                mib_builder = eng.getMibBuilder()
-                try:
-                    mib_builder.setMibSources()  # clear FS sources
-                except TypeError:
-                    pass
-                try:
-                    mib_builder.loadModules("SNMPv2-SMI", "SNMPv2-MIB", "__SNMPv2-MIB", "PYSNMP-SOURCE-MIB")
-                except Exception:
-                    pass
-            except Exception:
-                pass
-            return eng
-
-        self.engine = await self.hass.async_add_executor_job(_build_engine_with_minimal_preload)
+        if self.engine is None:
+            self.engine = await _get_engine(self.hass)
 
     async def _ensure_target(self) -> None:
+        # The current target stays usable until the next entry point swaps it
+        # for one carrying a raised timeout (see _note_timeout).
+        if self.target is not None and self._target_timeout != self.timeout:
+            _release_target(self.host, self.port, self._target_timeout, self.retries, self.target)
+            self.target = None
         if self.target is None:
-            self.target = await UdpTransportTarget.create(*self._target_args, **self._target_kwargs)
+            self._target_timeout = self.timeout
+            self.target = await _get_target(self.host, self.port, self.timeout, self.retries)
+
+    def close(self) -> None:
+        """Forget the cached transport for this device (entry unload)."""
+        _release_target(self.host, self.port, self._target_timeout, self.retries, self.target)
+        self.target = None
 
     # ---------- lifecycle / fetch ----------
 
@@ -314,43 +782,66 @@ class SwitchSnmpClient:
         await self._ensure_engine()
         await self._ensure_target()
 
-        # Build interface table and state first (names, alias, admin/oper)
-        await self._async_walk_interfaces(dynamic_only=False)
+        # System fields first: they double as a reachability probe.
+        (
+            self.cache["sysDescr"],
+            self.cache["sysName"],
+            self.cache["sysUpTime"],
+        ) = await _do_get_scalars(
+            self.engine,
+            self.community_data,
+            self.target,
+            self.context,
+            [
+                OID_sysDescr,
+                self._custom_oid("hostname") or OID_sysName,
+                self._custom_oid("uptime") or OID_sysUpTime,
+            ],
+        )
+
+        if self.cache["sysDescr"] is None and self.cache["sysName"] is None:
+            # Re-resolve the host name on the next attempt (DHCP/DNS change).
+            self.close()
+            raise UpdateFailed(f"No SNMP response from {self.host}")
+
+        # Build interface table and state (names, alias, admin/oper)
+        await self._async_walk_interfaces()
 
         # Build IPv4 maps and attach to interfaces (original repo logic)
         await self._async_walk_ipv4()
         self._attach_ipv4_to_interfaces()
+        self._mark_full_walk()
 
-        # System fields
-        self.cache["sysDescr"] = await self._async_get_one(OID_sysDescr)
-        self.cache["sysName"] = await self._async_get_one(self._custom_oid("hostname") or OID_sysName)
-        self.cache["sysUpTime"] = await self._async_get_one(self._custom_oid("uptime") or OID_sysUpTime)
-
-        # Model hint (optional)
-        ent_models = await self._async_walk(OID_entPhysicalModelName)
-        model_hint = None
-        for _oid, val in ent_models:
-            s = str(val).strip()
-            if s:
-                model_hint = s
-                break
-        self.cache["model"] = model_hint
-
-        # Manufacturer / firmware parsing from sysDescr (unchanged behavior)
         sd = (self.cache.get("sysDescr") or "").strip()
-        manufacturer = None
-        firmware = None
-        if sd:
-            parts = [p.strip() for p in sd.split(",")]
-            if len(parts) >= 2:
-                firmware = parts[1] or None
-            head = parts[0]
-            if model_hint and model_hint in head:
-                manufacturer = head.replace(model_hint, "").strip()
-            else:
-                toks = head.split()
-                if len(toks) > 1:
-                    manufacturer = " ".join(toks[:-1])
+        cached = _SYS_PARSE_CACHE.get((self.host, sd))
+        if cached is not None:
+            manufacturer, model_hint, firmware = cached
+        else:
+            # Model hint (optional)
+            ent_models = await self._async_walk(OID_entPhysicalModelName)
+            model_hint = None
+            for _oid, val in ent_models:
+                s = _octets_to_text(val).strip()
+                if s:
+                    model_hint = s
+                    break
+
+            # Manufacturer / firmware parsing from sysDescr (unchanged behavior)
+            manufacturer = None
+            firmware = None
+            if sd:
+                parts = [p.strip() for p in sd.split(",")]
+                if len(parts) >= 2:
+                    firmware = parts[1] or None
+                head = parts[0]
+                if model_hint and model_hint in head:
+                    manufacturer = head.replace(model_hint, "").strip()
+                else:
+                    toks = head.split()
+                    if len(toks) > 1:
+                        manufacturer = " ".join(toks[:-1])
+            _SYS_PARSE_CACHE[(self.host, sd)] = (manufacturer, model_hint, firmware)
+        self.cache["model"] = model_hint
 
         # Cisco CBS350: prefer ENTITY-MIB software revision when available.
         # This uses the documented entPhysicalSoftwareRev OID for the base chassis.
@@ -362,70 +853,56 @@ class SwitchSnmpClient:
             if sw_rev:
                 firmware = sw_rev.strip() or firmware
 
+        sd_l = sd.lower()
+
         # Zyxel: prefer vendor-specific manufacturer/firmware OIDs when detected
-        if "zyxel" in sd.lower():
+        if "zyxel" in sd_l:
             try:
-                zy_mfg = await self._async_get_one(OID_entPhysicalMfgName_Zyxel)
+                zy_mfg, zy_fw = await self._async_get_scalars(
+                    [OID_entPhysicalMfgName_Zyxel, OID_zyxel_firmware_version]
+                )
             except Exception:
-                zy_mfg = None
+                zy_mfg = zy_fw = None
             if zy_mfg:
                 manufacturer = zy_mfg.strip() or manufacturer
-
-            try:
-                zy_fw = await self._async_get_one(OID_zyxel_firmware_version)
-            except Exception:
-                zy_fw = None
             if zy_fw:
                 firmware = zy_fw.strip() or firmware
 
         # MikroTik RouterOS: override using MIKROTIK-MIB when detected
-        if "mikrotik" in sd.lower() or "routeros" in sd.lower():
+        if "mikrotik" in sd_l or "routeros" in sd_l:
             # Manufacturer should be a clean vendor name, not "RouterOS".
             manufacturer = "MikroTik"
 
             # Firmware version from routerBoardInfoSoftwareVersion (e.g. "7.20.6")
+            # and model name from routerBoardInfoModel (e.g. "CRS305-1G-4S+")
             try:
-                mk_ver = await self._async_get_one(OID_mikrotik_software_version)
+                mk_ver, mk_model = await self._async_get_scalars(
+                    [OID_mikrotik_software_version, OID_mikrotik_model]
+                )
             except Exception:
-                mk_ver = None
+                mk_ver = mk_model = None
             if mk_ver:
                 firmware = mk_ver.strip() or firmware
-
-            # Model name from routerBoardInfoModel (e.g. "CRS305-1G-4S+")
-            try:
-                mk_model = await self._async_get_one(OID_mikrotik_model)
-            except Exception:
-                mk_model = None
             if mk_model:
                 self.cache["model"] = mk_model.strip() or self.cache.get("model")
 
         # Custom OIDs: per-device overrides take precedence over vendor logic and generic parsing
-        try:
-            mfg_oid = self._custom_oid("manufacturer")
-            if mfg_oid:
-                mfg_val = await self._async_get_one(mfg_oid)
-                if mfg_val:
-                    manufacturer = mfg_val.strip() or manufacturer
-        except Exception:
-            pass
-
-        try:
-            fw_oid = self._custom_oid("firmware")
-            if fw_oid:
-                fw_val = await self._async_get_one(fw_oid)
-                if fw_val:
-                    firmware = fw_val.strip() or firmware
-        except Exception:
-            pass
-
-        try:
-            model_oid = self._custom_oid("model")
-            if model_oid:
-                model_val = await self._async_get_one(model_oid)
-                if model_val:
-                    self.cache["model"] = model_val.strip() or self.cache.get("model")
-        except Exception:
-            pass
+        custom = {
+            key: oid
+            for key in ("manufacturer", "firmware", "model")
+            if (oid := self._custom_oid(key))
+        }
+        if custom:
+            try:
+                values = dict(zip(custom, await self._async_get_scalars(list(custom.values()))))
+            except Exception:
+                values = {}
+            if values.get("manufacturer"):
+                manufacturer = values["manufacturer"].strip() or manufacturer
+            if values.get("firmware"):
+                firmware = values["firmware"].strip() or firmware
+            if values.get("model"):
+                self.cache["model"] = values["model"].strip() or self.cache.get("model")
 
         self.cache["manufacturer"] = manufacturer
         self.cache["firmware"] = firmware
@@ -435,106 +912,196 @@ class SwitchSnmpClient:
         await self._ensure_target()
         return await _do_get_one(self.engine, self.community_data, self.target, self.context, oid)
 
-    async def _async_walk(self, base_oid: str) -> list[tuple[str, Any]]:
+    async def _async_get_scalars(self, oids: list[str]) -> list[Optional[str]]:
         await self._ensure_engine()
         await self._ensure_target()
-        out: list[tuple[str, Any]] = []
+        return await _do_get_scalars(self.engine, self.community_data, self.target, self.context, oids)
+
+    async def _async_iter_walk(self, base_oid: str) -> AsyncIterator[Tuple[str, Any]]:
+        """Stream a walk, one (oid, value) pair at a time.
+
+        Uses GETBULK (we always talk v2c); if that yields nothing, the column
+        is re-walked with GETNEXT for agents with a broken GETBULK. The
+        fallback is skipped when the walk timed out or GETBULK has already
+        been seen working on this device.
+        """
+        await self._ensure_engine()
+        await self._ensure_target()
+        found = False
+        timed_out: list[bool] = []
+        async for _base, oid_str, val in _do_bulk_walk(
+            self.engine,
+            self.community_data,
+            self.target,
+            self.context,
+            [base_oid],
+            self._max_reps,
+            self._shrink_max_reps,
+            self._note_timeout,
+            timed_out.append,
+        ):
+            found = True
+            yield oid_str, val
+        if found:
+            self._walk_ok = True
+            return
+        if self._walk_ok or any(timed_out):
+            return
         async for oid_str, val in _do_next_walk(self.engine, self.community_data, self.target, self.context, base_oid):
-            out.append((oid_str, val))
-        return out
+            yield oid_str, val
 
-    async def _async_walk_interfaces(self, dynamic_only: bool = False) -> None:
-        if not dynamic_only:
-            self.cache["ifTable"] = {}
-
-            # Indexes
-            for oid, val in await self._async_walk(OID_ifIndex):
-                idx = int(oid.split(".")[-1])
-                self.cache["ifTable"][idx] = {"index": idx}
-
-            # Descriptions
-            for oid, val in await self._async_walk(OID_ifDescr):
-                idx = int(oid.split(".")[-1])
-                self.cache["ifTable"].setdefault(idx, {})["descr"] = str(val)
-
-            # Names
-            for oid, val in await self._async_walk(OID_ifName):
-                idx = int(oid.split(".")[-1])
-                self.cache["ifTable"].setdefault(idx, {})["name"] = str(val)
-
-            # Aliases
-            for oid, val in await self._async_walk(OID_ifAlias):
-                idx = int(oid.split(".")[-1])
-                self.cache["ifTable"].setdefault(idx, {})["alias"] = str(val)
-
-            # Speeds (prefer ifHighSpeed where present; fall back to ifSpeed)
-            for oid, val in await self._async_walk(OID_ifSpeed):
-                idx = int(oid.split(".")[-1])
-                try:
-                    bps = int(val)
-                except Exception:
-                    continue
-                if bps > 0:
-                    self.cache["ifTable"].setdefault(idx, {})["speed_bps"] = bps
+    async def _async_walk(self, base_oid: str) -> list[tuple[str, Any]]:
+        return [item async for item in self._async_iter_walk(base_oid)]
 
-            for oid, val in await self._async_walk(OID_ifHighSpeed):
-                idx = int(oid.split(".")[-1])
-                try:
-                    v = int(val)
-                except Exception:
-                    continue
-                # ifHighSpeed is defined as Mbps (IF-MIB), but some devices incorrectly return bps.
-                # Heuristic: values >= 1,000,000 are treated as bps to avoid 1e6x inflation.
-                if v > 0:
-                    bps = v if v >= 1_000_000 else v * 1_000_000
-                    self.cache["ifTable"].setdefault(idx, {})["speed_bps"] = bps
-
-            # VLAN (PVID) mapping via BRIDGE-MIB / Q-BRIDGE-MIB
-            # Map ifIndex -> dot1dBasePort -> dot1qPvid (untagged VLAN)
-            try:
-                baseport_by_ifindex: Dict[int, int] = {}
-                for oid, val in await self._async_walk(OID_dot1dBasePortIfIndex):
-                    # Instance: ...1.4.1.2.<basePort>
-                    base_port = int(oid.split(".")[-1])
-                    if_index = int(val)
-                    if if_index > 0 and base_port > 0:
-                        baseport_by_ifindex[if_index] = base_port
-
-                if baseport_by_ifindex:
-                    pvid_by_baseport: Dict[int, int] = {}
-                    for oid, val in await self._async_walk(OID_dot1qPvid):
-                        # Instance: ...5.1.1.<basePort>
-                        base_port = int(oid.split(".")[-1])
-                        try:
-                            pvid = int(val)
-                        except Exception:
-                            continue
-                        if pvid > 0:
-                            pvid_by_baseport[base_port] = pvid
-
-                    if pvid_by_baseport:
-                        for if_index, base_port in baseport_by_ifindex.items():
-                            pvid = pvid_by_baseport.get(base_port)
-                            if pvid is not None:
-                                self.cache["ifTable"].setdefault(if_index, {})["vlan_id"] = pvid
-            except Exception:
-                # VLAN discovery is optional; ignore devices that don't implement these MIBs
-                pass
+    async def _async_iter_columns(
+        self, base_oids: list[str], on_abort: Optional[Callable[[bool], None]] = None
+    ) -> AsyncIterator[Tuple[str, str, Any]]:
+        """Stream several columns from one GETBULK walk.
 
-            # Display name preference from original repo
-            for idx, rec in list(self.cache["ifTable"].items()):
-                nm = (rec.get("name") or "").strip()
-                ds = (rec.get("descr") or "").strip()
-                rec["display_name"] = nm or ds or f"ifIndex {idx}"
+        Yields (base_oid, oid, value) as the varbinds arrive. Repetitions
+        are scaled down with the number of columns to keep responses small.
+        on_abort is passed through to _do_bulk_walk.
+        """
+        await self._ensure_engine()
+        await self._ensure_target()
+        max_reps = min(self._max_reps, max(MIN_MAX_REPETITIONS, _BULK_VARBINDS // len(base_oids)))
+        async for item in _do_bulk_walk(
+            self.engine,
+            self.community_data,
+            self.target,
+            self.context,
+            base_oids,
+            max_reps,
+            self._shrink_max_reps_columns(len(base_oids)),
+            self._note_timeout,
+            on_abort,
+        ):
+            self._walk_ok = True
+            yield item
+
+    async def _async_collect_columns(
+        self,
+        columns: Dict[str, Callable[[Any], Any]],
+        key: Callable[[str], Any] = _row_index,
+    ) -> Dict[str, Dict[Any, Any]]:
+        """Walk several columns together into row index -> value maps.
+
+        Each value is converted as it arrives (so the pysnmp objects can be
+        dropped right away); values converted to None are skipped. Rows are
+        keyed by key(oid), the last sub-identifier by default. Columns
+        that come back empty from GETBULK are retried with GETNEXT, unless
+        the walk timed out or GETBULK has already worked on this device.
+        """
+        out: Dict[str, Dict[Any, Any]] = {base: {} for base in columns}
+        timed_out: list[bool] = []
+        async for base, oid_str, val in self._async_iter_columns(list(columns), timed_out.append):
+            value = columns[base](val)
+            if value is not None:
+                out[base][key(oid_str)] = value
+        if self._walk_ok or any(timed_out):
+            return out
+        for base, by_idx in out.items():
+            if by_idx:
+                continue
+            convert = columns[base]
+            async for oid_str, val in _do_next_walk(
+                self.engine, self.community_data, self.target, self.context, base
+            ):
+                value = convert(val)
+                if value is not None:
+                    by_idx[key(oid_str)] = value
+        return out
 
-        # Dynamic state only
-        for oid, val in await self._async_walk(OID_ifAdminStatus):
-            idx = int(oid.split(".")[-1])
-            self.cache["ifTable"].setdefault(idx, {})["admin"] = int(val)
+    async def _async_walk_interfaces(self) -> None:
+        """Walk the interface tables and replace the cached ifTable wholesale.
 
-        for oid, val in await self._async_walk(OID_ifOperStatus):
-            idx = int(oid.split(".")[-1])
-            self.cache["ifTable"].setdefault(idx, {})["oper"] = int(val)
+        Rows for interfaces that no longer exist are dropped with it.
+        """
+        # The ifTable/ifXTable columns share the ifIndex row key and are
+        # walked side by side in one GETBULK walk; the bridge columns are
+        # keyed by base port and walked concurrently alongside.
+        cols, bridge = await asyncio.gather(
+            self._async_collect_columns(
+                {
+                    OID_ifIndex: _as_int,
+                    OID_ifDescr: _interned_text,
+                    OID_ifName: _interned_text,
+                    OID_ifAlias: _interned_text,
+                    OID_ifSpeed: _as_int,
+                    OID_ifHighSpeed: _as_int,
+                    OID_ifAdminStatus: _as_int,
+                    OID_ifOperStatus: _as_int,
+                }
+            ),
+            self._async_collect_columns(
+                {OID_dot1dBasePortIfIndex: _as_int, OID_dot1qPvid: _as_int}
+            ),
+        )
+
+        # Each column arrives as its own ifIndex -> value map; rows are
+        # assembled once at the end.
+        admin_by_idx = cols[OID_ifAdminStatus]
+        oper_by_idx = cols[OID_ifOperStatus]
+
+        index_by_idx = cols[OID_ifIndex]
+        descr_by_idx = cols[OID_ifDescr]
+        name_by_idx = cols[OID_ifName]
+        alias_by_idx = cols[OID_ifAlias]
+
+        # Speeds (prefer ifHighSpeed where present; fall back to ifSpeed)
+        speed_by_idx = {idx: bps for idx, bps in cols[OID_ifSpeed].items() if bps > 0}
+        for idx, v in cols[OID_ifHighSpeed].items():
+            # ifHighSpeed is defined as Mbps (IF-MIB), but some devices incorrectly return bps.
+            # Heuristic: values >= 1,000,000 are treated as bps to avoid 1e6x inflation.
+            if v > 0:
+                speed_by_idx[idx] = v if v >= 1_000_000 else v * 1_000_000
+
+        # VLAN (PVID) mapping via BRIDGE-MIB / Q-BRIDGE-MIB
+        # Map ifIndex -> dot1dBasePort -> dot1qPvid (untagged VLAN)
+        vlan_by_idx: Dict[int, int] = {}
+        try:
+            baseport_by_ifindex: Dict[int, int] = {}
+            # Instance: ...1.4.1.2.<basePort>
+            for base_port, if_index in bridge[OID_dot1dBasePortIfIndex].items():
+                if if_index > 0 and base_port > 0:
+                    baseport_by_ifindex[if_index] = base_port
+
+            if baseport_by_ifindex:
+                # Instance: ...5.1.1.<basePort>
+                pvid_by_baseport = {bp: pvid for bp, pvid in bridge[OID_dot1qPvid].items() if pvid > 0}
+                for if_index, base_port in baseport_by_ifindex.items():
+                    pvid = pvid_by_baseport.get(base_port)
+                    if pvid is not None:
+                        vlan_by_idx[if_index] = pvid
+        except Exception:
+            # VLAN discovery is optional; ignore devices that don't implement these MIBs
+            pass
+
+        columns = (
+            ("descr", descr_by_idx),
+            ("name", name_by_idx),
+            ("alias", alias_by_idx),
+            ("speed_bps", speed_by_idx),
+            ("vlan_id", vlan_by_idx),
+            ("admin", admin_by_idx),
+            ("oper", oper_by_idx),
+        )
+        all_idx = dict.fromkeys(index_by_idx)
+        for _key, by_idx in columns:
+            all_idx.update(dict.fromkeys(by_idx))
+
+        if_table: Dict[int, Dict[str, Any]] = {}
+        for idx in all_idx:
+            rec: Dict[str, Any] = {"index": idx} if idx in index_by_idx else {}
+            for key, by_idx in columns:
+                if idx in by_idx:
+                    rec[key] = by_idx[idx]
+            # Display name preference from original repo
+            nm = (rec.get("name") or "").strip()
+            ds = (rec.get("descr") or "").strip()
+            rec["display_name"] = nm or ds or f"ifIndex {idx}"
+            if_table[idx] = rec
+        self.cache["ifTable"] = if_table
 
     async def _async_walk_ipv4(self) -> None:
         """
@@ -554,6 +1121,12 @@ class SwitchSnmpClient:
             Some vendors (e.g., Cisco CBS series, Arista) return ipAdEntAddr/ipAdEntNetMask
             as raw octets instead of a printable IpAddress. This helper keeps existing
             behavior for vendors that already return dotted strings."""
+            # IpAddress is a 4-octet OctetString: decode the octets directly
+            # rather than round-tripping through pysnmp's pretty-printer.
+            if isinstance(val, univ.OctetString):
+                raw = val.asOctets()
+                if len(raw) == 4:
+                    return socket.inet_ntoa(raw)
             s = str(val)
             parts = s.split(".")
             if len(parts) == 4 and all(p.isdigit() for p in parts):
@@ -586,107 +1159,115 @@ class SwitchSnmpClient:
                             b = None
         
             if b and len(b) == 4:
-                return ".".join(str(x) for x in b)
+                return socket.inet_ntoa(b)
         
             # Fallback: give the original string representation
             return s
 
-        # ---- (1) Legacy table: ipAdEnt* ----
-        legacy_addrs = await self._async_walk(OID_ipAdEntAddr)
-        if legacy_addrs:
-            for _oid, val in legacy_addrs:
-                ip_index[_normalize_ipv4(val)] = None  # type: ignore[assignment]
-
-            for oid, val in await self._async_walk(OID_ipAdEntIfIndex):
-                parts = oid.split(".")[-4:]
-                ip = ".".join(parts)
-                try:
-                    ip_index[ip] = int(val)
-                except Exception:
-                    continue
+        def _ip_to_int(ip: str) -> int:
+            # Keys are dotted quads taken from OID suffixes; inet_aton parses
+            # them in C instead of a split plus four int() calls.
+            return int.from_bytes(socket.inet_aton(ip), "big")
 
-            for oid, val in await self._async_walk(OID_ipAdEntNetMask):
-                parts = oid.split(".")[-4:]
-                ip = ".".join(parts)
-                ip_mask[ip] = _normalize_ipv4(val)
+        # The four sources are independent, so they are walked concurrently.
+        # Each one streams into its own map; the maps are merged below in
+        # the original precedence order.
+
+        # ---- (1) Legacy table: ipAdEnt* ----
+        # The instance suffix of every ipAdEnt column is the address itself,
+        # so ifIndex and netmask are walked together and keyed by suffix
+        # (both columns have the same prefix length).
+        async def _walk_legacy() -> None:
+            cols = await self._async_collect_columns(
+                {
+                    OID_ipAdEntIfIndex: _as_int,
+                    OID_ipAdEntNetMask: lambda val: sys.intern(_normalize_ipv4(val)),
+                },
+                key=lambda oid: oid[_SUFFIX_ipAdEntIfIndex:],
+            )
+            for ip, idx in cols[OID_ipAdEntIfIndex].items():
+                if ip.count(".") == 3:
+                    ip_index[ip] = idx
+            for ip, mask in cols[OID_ipAdEntNetMask].items():
+                if ip.count(".") == 3:
+                    ip_mask[ip] = mask
 
         # ---- (2) IP-MIB ipAddressIfIndex: parse instance suffix (1.4.a.b.c.d)
-        try:
-            for oid, val in await self._async_walk(OID_ipAddressIfIndex):
-                suffix = oid[len(OID_ipAddressIfIndex) + 1 :]
-                parts = [int(x) for x in suffix.split(".") if x]
-                for i in range(len(parts) - 6 + 1):
-                    if parts[i] == 1 and parts[i + 1] == 4:
-                        a, b, c, d = parts[i + 2 : i + 6]
-                        ip = f"{a}.{b}.{c}.{d}"
-                        try:
-                            idx = int(val)
-                            ip_index.setdefault(ip, idx)
-                        except Exception:
-                            pass
-                        break
-        except Exception:
-            pass  # IP-MIB may be absent
+        ip_mib_index: Dict[str, int] = {}
+
+        async def _walk_ip_mib() -> None:
+            try:
+                async for oid, val in self._async_iter_walk(OID_ipAddressIfIndex):
+                    suffix = oid[_SUFFIX_ipAddressIfIndex:]
+                    parts = [int(x) for x in suffix.split(".") if x]
+                    for i in range(len(parts) - 6 + 1):
+                        if parts[i] == 1 and parts[i + 1] == 4:
+                            a, b, c, d = parts[i + 2 : i + 6]
+                            if isinstance(val, univ.Integer):
+                                ip_mib_index.setdefault(f"{a}.{b}.{c}.{d}", int(val))
+                            break
+            except Exception:
+                pass  # IP-MIB may be absent
 
         # ---- (3) OSPF-MIB ospfIfIpAddress: suffix a.b.c.d.<ifIndex>.<area...>
-        try:
-            for oid, val in await self._async_walk(OID_ospfIfIpAddress):
-                try:
-                    suffix = oid[len(OID_ospfIfIpAddress) + 1 :]
-                    parts = [int(x) for x in suffix.split(".")]
-                    if len(parts) >= 5:
-                        a, b, c, d = parts[0], parts[1], parts[2], parts[3]
-                        if_index = parts[4]
-                        ip = f"{a}.{b}.{c}.{d}"
-                        ip_index.setdefault(ip, int(if_index))
-                except Exception:
-                    continue
-        except Exception:
-            pass  # OSPF-MIB may be absent
+        ospf_index: Dict[str, int] = {}
+
+        async def _walk_ospf() -> None:
+            try:
+                async for oid, val in self._async_iter_walk(OID_ospfIfIpAddress):
+                    try:
+                        suffix = oid[_SUFFIX_ospfIfIpAddress:]
+                        parts = [int(x) for x in suffix.split(".")]
+                        if len(parts) >= 5:
+                            a, b, c, d = parts[0], parts[1], parts[2], parts[3]
+                            if_index = parts[4]
+                            ip = f"{a}.{b}.{c}.{d}"
+                            ospf_index.setdefault(ip, int(if_index))
+                    except Exception:
+                        continue
+            except Exception:
+                pass  # OSPF-MIB may be absent
 
         # ---- (4) Derive mask bits from IP-FORWARD-MIB route instances (.7.1.9)
         route_prefixes: List[Tuple[int, int]] = []
 
-        def _bits_to_mask(bits: int) -> str:
-            if bits <= 0:
-                return "0.0.0.0"
-            if bits >= 32:
-                return "255.255.255.255"
-            mask = (0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF
-            return ".".join(str((mask >> s) & 0xFF) for s in (24, 16, 8, 0))
-
-        def _ip_to_int(ip: str) -> int:
-            a, b, c, d = (int(x) for x in ip.split("."))
-            return (a << 24) | (b << 16) | (c << 8) | d
-
-        try:
-            for oid, _val in await self._async_walk(OID_routeCol):
-                try:
-                    suffix = oid[len(OID_routeCol) + 1 :]
-                    parts = [int(x) for x in suffix.split(".") if x]
-
-                    for i in range(len(parts) - 7):
-                        if parts[i] == 1 and parts[i + 1] == 4:
-                            a, b, c, d = parts[i + 2 : i + 6]
-                            bits = parts[i + 6] if i + 6 < len(parts) else None
-                            if bits is None or bits < 0 or bits > 32:
+        async def _walk_routes() -> None:
+            try:
+                async for oid, _val in self._async_iter_walk(OID_routeCol):
+                    try:
+                        for m in _ROUTE_DEST_RE.finditer(oid, _SUFFIX_routeCol):
+                            a, b, c, d, bits = map(int, m.groups())
+                            if bits > 32:
                                 continue
-                            net_int = _ip_to_int(f"{a}.{b}.{c}.{d}")
-                            route_prefixes.append((net_int, bits))
+                            route_prefixes.append(((a << 24) | (b << 16) | (c << 8) | d, bits))
                             break
-                except Exception:
-                    continue
-        except Exception:
-            pass  # table may be absent on some vendors
+                    except Exception:
+                        continue
+            except Exception:
+                pass  # table may be absent on some vendors
+
+        await asyncio.gather(_walk_legacy(), _walk_ip_mib(), _walk_ospf(), _walk_routes())
+        for extra in (ip_mib_index, ospf_index):
+            for ip, idx in extra.items():
+                ip_index.setdefault(ip, idx)
 
         if route_prefixes and ip_index:
-            route_prefixes.sort(key=lambda t: t[1], reverse=True)
-            for ip in list(ip_index.keys()):
+            # Index the masked networks by prefix length so each address is
+            # probed once per distinct length (longest first) instead of
+            # being compared against every route.
+            nets_by_bits: Dict[int, set[int]] = {}
+            for net_int, bits in route_prefixes:
+                mask_int = (0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF if bits else 0
+                nets_by_bits.setdefault(bits, set()).add(net_int & mask_int)
+            probes = [
+                ((0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF if bits else 0, bits, nets_by_bits[bits])
+                for bits in sorted(nets_by_bits, reverse=True)
+            ]
+            for ip in ip_index:
                 ip_int = _ip_to_int(ip)
-                for net_int, bits in route_prefixes:
-                    mask_int = (0xFFFFFFFF << (32 - bits)) & 0xFFFFFFFF if bits else 0
-                    if bits == 0 or (ip_int & mask_int) == (net_int & mask_int):
-                        ip_mask[ip] = _bits_to_mask(bits)
+                for mask_int, bits, nets in probes:
+                    if (ip_int & mask_int) in nets:
+                        ip_mask[ip] = _MASK_LUT[bits]
                         break
 
         # Commit maps to cache
@@ -705,24 +1286,10 @@ class SwitchSnmpClient:
             for k in (
                 "ipv4", "ip", "netmask", "cidr",
                 "ip_address", "ipv4_address", "ipv4_netmask", "ipv4_cidr",
-                "ip_cidr_str",
+                "ip_cidr_str", "ip_display",
             ):
                 rec.pop(k, None)
 
-        def _mask_to_prefix(mask: str | None) -> Optional[int]:
-            if not mask:
-                return None
-            try:
-                parts = [int(p) for p in mask.split(".")]
-                if len(parts) != 4 or any(p < 0 or p > 255 for p in parts):
-                    return None
-                bits = "".join(f"{p:08b}" for p in parts)
-                if "01" in bits:
-                    return None
-                return bits.count("1")
-            except Exception:
-                return None
-
         # Attach; if mask present convert to prefix bits for /cidr string
         for ip, idx in ip_idx.items():
             if not idx:
@@ -731,12 +1298,19 @@ class SwitchSnmpClient:
             if not rec:
                 continue
             mask = ip_mask.get(ip)
-            prefix = _mask_to_prefix(mask)
+            prefix = mask_to_prefix(mask)
             rec.setdefault("ipv4", []).append({"ip": ip, "netmask": mask, "cidr": prefix})
 
         # Convenience single-address fields for UI (unchanged behavior)
         for rec in if_table.values():
             addrs = rec.get("ipv4") or []
+            if addrs:
+                # Display form of the first address ("ip/bits" or "ip"),
+                # formatted once per IPv4 walk instead of per entity update.
+                first = addrs[0]
+                rec["ip_display"] = (
+                    first["ip"] if first["cidr"] is None else f"{first['ip']}/{first['cidr']}"
+                )
             if len(addrs) == 1:
                 ip = addrs[0]["ip"]
                 mask = addrs[0]["netmask"]
@@ -751,19 +1325,68 @@ class SwitchSnmpClient:
                 if prefix is not None:
                     rec["ip_cidr_str"] = f"{ip}/{prefix}"
 
+    def _mark_full_walk(self) -> None:
+        self._full_walk_ts = self._dynamic_ts = time.monotonic()
+        self._full_walk_ttl = _IF_TABLE_TTL * random.uniform(0.9, 1.1)
+
+    def _admin_oid(self, idx: int) -> str:
+        """Return the ifAdminStatus instance OID for idx."""
+        oid = self._admin_oid_cache.get(idx)
+        if oid is None:
+            oid = self._admin_oid_cache[idx] = f"{OID_ifAdminStatus}.{idx}"
+        return oid
+
+    async def _async_get_if_states(self) -> bool:
+        """Refresh admin/oper with one two-column GETBULK walk.
+
+        Only rows that had an admin status on the last full walk are tracked;
+        rows built from other columns alone (e.g. bridge ports) never have
+        one. Returns False when that set of ifIndexes changed, in which case
+        the caller should fall back to a full walk.
+        """
+        if_table: Dict[int, Dict[str, Any]] = self.cache.get("ifTable") or {}
+        if not if_table:
+            return False
+        known = {idx for idx, rec in if_table.items() if "admin" in rec}
+        cols = await self._async_collect_columns({OID_ifAdminStatus: _as_int, OID_ifOperStatus: _as_int})
+        admin_by_idx = cols[OID_ifAdminStatus]
+        if admin_by_idx.keys() != known:
+            return False
+        oper_by_idx = cols[OID_ifOperStatus]
+        for idx, admin in admin_by_idx.items():
+            rec = if_table[idx]
+            rec["admin"] = admin
+            oper = oper_by_idx.get(idx)
+            if oper is not None:
+                rec["oper"] = oper
+        return True
+
     async def async_refresh_all(self) -> None:
-        await self._ensure_engine()
-        await self._ensure_target()
-        await self._async_walk_interfaces(dynamic_only=False)
+        async with self._dynamic_lock:
+            await self._ensure_engine()
+            await self._ensure_target()
+            await self._async_full_walk()
+
+    async def _async_full_walk(self) -> None:
+        """Re-walk interfaces (all columns) and IPv4, replacing the cached tables."""
+        await self._async_walk_interfaces()
         await self._async_walk_ipv4()
         self._attach_ipv4_to_interfaces()
+        self._mark_full_walk()
 
     async def async_refresh_dynamic(self) -> None:
-        await self._ensure_engine()
-        await self._ensure_target()
-        await self._async_walk_interfaces(dynamic_only=True)
-        await self._async_walk_ipv4()
-        self._attach_ipv4_to_interfaces()
+        async with self._dynamic_lock:
+            now = time.monotonic()
+            if (now - self._dynamic_ts) < self._dynamic_ttl:
+                return
+            await self._ensure_engine()
+            await self._ensure_target()
+            if (now - self._full_walk_ts) < self._full_walk_ttl and await self._async_get_if_states():
+                self._dynamic_ts = time.monotonic()
+                return
+            # TTL expired or a known row vanished: a real full walk, so
+            # removed interfaces are dropped and names/speeds are re-read.
+            await self._async_full_walk()
 
     # ---------- coordinator hook ----------
     async def async_poll(self) -> Dict[str, Any]:
@@ -787,11 +1410,18 @@ class SwitchSnmpClient:
         sysname_oid = self._custom_oid("hostname") or OID_sysName
         uptime_oid = self._custom_oid("uptime") or OID_sysUpTime
 
-        sysdescr, sysname, sysuptime = await asyncio.gather(
-            _do_get_one(self.engine, self.community_data, self.target, self.context, OID_sysDescr),
-            _do_get_one(self.engine, self.community_data, self.target, self.context, sysname_oid),
-            _do_get_one(self.engine, self.community_data, self.target, self.context, uptime_oid) if poll_uptime else asyncio.sleep(0, result=None),
-        )
+        sys_oids = [OID_sysDescr, sysname_oid]
+        if poll_uptime:
+            sys_oids.append(uptime_oid)
+        sys_vals = await _do_get_scalars(self.engine, self.community_data, self.target, self.context, sys_oids)
+        sysdescr, sysname = sys_vals[0], sys_vals[1]
+        if sysdescr is None and sysname is None:
+            # Device is not answering: fail fast rather than letting every
+            # following walk run into its own timeout. The cached target pins
+            # the resolved address, so drop it to re-resolve next time.
+            self.close()
+            raise UpdateFailed(f"No SNMP response from {self.host}")
+        sysuptime = sys_vals[2] if poll_uptime else None
         if (not poll_uptime) and ("sysUpTime" in self.cache):
             sysuptime = self.cache.get("sysUpTime")
         if sysdescr is not None:
@@ -835,92 +1465,50 @@ class SwitchSnmpClient:
                 if sw_rev:
                     firmware = sw_rev.strip() or firmware
 
+            sd_l = sd.lower()
+
             # Zyxel: prefer vendor-specific manufacturer/firmware OIDs when detected
-            if "zyxel" in sd.lower():
+            if "zyxel" in sd_l:
                 try:
-                    zy_mfg = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        OID_entPhysicalMfgName_Zyxel,
+                    zy_mfg, zy_fw = await self._async_get_scalars(
+                        [OID_entPhysicalMfgName_Zyxel, OID_zyxel_firmware_version]
                     )
                 except Exception:
-                    zy_mfg = None
+                    zy_mfg = zy_fw = None
                 if zy_mfg:
                     manufacturer = zy_mfg.strip() or manufacturer
-
-                try:
-                    zy_fw = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        OID_zyxel_firmware_version,
-                    )
-                except Exception:
-                    zy_fw = None
                 if zy_fw:
                     firmware = zy_fw.strip() or firmware
 
             # MikroTik RouterOS: override using MIKROTIK-MIB when detected
-            if "mikrotik" in sd.lower() or "routeros" in sd.lower():
+            if "mikrotik" in sd_l or "routeros" in sd_l:
                 manufacturer = "MikroTik"
                 try:
-                    mk_ver = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        OID_mikrotik_software_version,
+                    mk_ver, mk_model = await self._async_get_scalars(
+                        [OID_mikrotik_software_version, OID_mikrotik_model]
                     )
                 except Exception:
-                    mk_ver = None
+                    mk_ver = mk_model = None
                 if mk_ver:
                     firmware = mk_ver.strip() or firmware
-                try:
-                    mk_model = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        OID_mikrotik_model,
-                    )
-                except Exception:
-                    mk_model = None
                 if mk_model:
                     self.cache["model"] = mk_model.strip() or self.cache.get("model")
 
             # Custom OIDs: per-device overrides take precedence over vendor logic and generic parsing
-            try:
-                mfg_oid = self._custom_oid("manufacturer")
-                if mfg_oid:
-                    mfg_val = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        mfg_oid,
-                    )
-                    if mfg_val:
-                        manufacturer = mfg_val.strip() or manufacturer
-            except Exception:
-                pass
-
-            try:
-                fw_oid = self._custom_oid("firmware")
-                if fw_oid:
-                    fw_val = await _do_get_one(
-                        self.engine,
-                        self.community_data,
-                        self.target,
-                        self.context,
-                        fw_oid,
-                    )
-                    if fw_val:
-                        firmware = fw_val.strip() or firmware
-            except Exception:
-                pass
+            custom = {
+                key: oid
+                for key in ("manufacturer", "firmware")
+                if (oid := self._custom_oid(key))
+            }
+            if custom:
+                try:
+                    values = dict(zip(custom, await self._async_get_scalars(list(custom.values()))))
+                except Exception:
+                    values = {}
+                if values.get("manufacturer"):
+                    manufacturer = values["manufacturer"].strip() or manufacturer
+                if values.get("firmware"):
+                    firmware = values["firmware"].strip() or firmware
 
             self.cache["manufacturer"] = manufacturer
             self.cache["firmware"] = firmware
@@ -938,22 +1526,10 @@ class SwitchSnmpClient:
                 try:
                     iftable = self.cache.get("ifTable", {}) or {}
 
-                    def _clean_list(key: str) -> list[str]:
-                        return [str(s).strip().lower() for s in (self._bandwidth_options.get(key, []) or []) if str(s).strip()]
-
-                    include_starts = _clean_list(CONF_BW_INCLUDE_STARTS_WITH)
-                    include_contains = _clean_list(CONF_BW_INCLUDE_CONTAINS)
-                    include_ends = _clean_list(CONF_BW_INCLUDE_ENDS_WITH)
-                    exclude_starts = _clean_list(CONF_BW_EXCLUDE_STARTS_WITH)
-                    exclude_contains = _clean_list(CONF_BW_EXCLUDE_CONTAINS)
-                    exclude_ends = _clean_list(CONF_BW_EXCLUDE_ENDS_WITH)
-
-                    def _matches_any(name_l: str, starts: list[str], contains: list[str], ends: list[str]) -> bool:
-                        return (
-                            any(name_l.startswith(x) for x in starts)
-                            or any(x in name_l for x in contains)
-                            or any(name_l.endswith(x) for x in ends)
-                        )
+                    has_include = self._bw_has_include
+                    has_exclude = self._bw_has_exclude
+                    include_match = self._bw_include_match
+                    exclude_match = self._bw_exclude_match
 
                     selected: list[int] = []
                     for idx, row in iftable.items():
@@ -964,18 +1540,16 @@ class SwitchSnmpClient:
                         raw_name = str(row.get("name") or "").strip()
                         if not raw_name:
                             continue
-                        nl = raw_name.lower()
-                        include_hit = _matches_any(nl, include_starts, include_contains, include_ends)
-                        exclude_hit = _matches_any(nl, exclude_starts, exclude_contains, exclude_ends)
-
-                        # If include rules are defined, only include matches.
-                        if (include_starts or include_contains or include_ends):
-                            if not include_hit:
+                        # Without rules (the usual case) every named
+                        # interface is selected; skip the matching.
+                        if has_include or has_exclude:
+                            nl = raw_name.lower()
+                            # If include rules are defined, only include matches.
+                            if has_include and not include_match(nl):
+                                continue
+                            # Exclude always wins
+                            if has_exclude and exclude_match(nl):
                                 continue
-
-                        # Exclude always wins
-                        if exclude_hit:
-                            continue
 
                         selected.append(idx_i)
 
@@ -999,29 +1573,29 @@ class SwitchSnmpClient:
                     rx_base = OID_ifHCInOctets if use_hc else OID_ifInOctets
                     tx_base = OID_ifHCOutOctets if use_hc else OID_ifOutOctets
 
-                    oids: list[str] = []
-                    for idx_i in selected:
-                        oids.append(f"{rx_base}.{idx_i}")
-                        oids.append(f"{tx_base}.{idx_i}")
-
-                    got = await _do_get_many(self.engine, self.community_data, self.target, self.context, oids)
+                    if len(selected) * 2 >= len(iftable):
+                        # Most ports are selected: walking both counter
+                        # columns takes far fewer PDUs than per-port GETs.
+                        cols = await self._async_collect_columns({rx_base: _as_int, tx_base: _as_int})
+                        rx_by_idx = cols[rx_base]
+                        tx_by_idx = cols[tx_base]
+                    else:
+                        oids: list[str] = []
+                        for idx_i in selected:
+                            oids.append(f"{rx_base}.{idx_i}")
+                            oids.append(f"{tx_base}.{idx_i}")
+                        got = await _do_get_many(
+                            self.engine, self.community_data, self.target, self.context, oids, convert=_as_int
+                        )
+                        rx_by_idx = {idx_i: got.get(f"{rx_base}.{idx_i}") for idx_i in selected}
+                        tx_by_idx = {idx_i: got.get(f"{tx_base}.{idx_i}") for idx_i in selected}
 
                     bw_out: Dict[int, Dict[str, Any]] = {}
                     for idx_i in selected:
-                        rx_oid = f"{rx_base}.{idx_i}"
-                        tx_oid = f"{tx_base}.{idx_i}"
-                        rx_v = got.get(rx_oid)
-                        tx_v = got.get(tx_oid)
-                        if rx_v is None and tx_v is None:
+                        rx_oct = rx_by_idx.get(idx_i)
+                        tx_oct = tx_by_idx.get(idx_i)
+                        if rx_oct is None and tx_oct is None:
                             continue
-                        try:
-                            rx_oct = int(rx_v) if rx_v is not None else None
-                        except Exception:
-                            rx_oct = None
-                        try:
-                            tx_oct = int(tx_v) if tx_v is not None else None
-                        except Exception:
-                            tx_oct = None
 
                         last = self._bw_last.get(idx_i) or {}
                         last_ts = float(last.get("ts") or 0.0)
@@ -1031,16 +1605,12 @@ class SwitchSnmpClient:
                         tx_bps = None
                         if dt > 0:
                             if rx_oct is not None and last.get("rx") is not None:
-                                prev = int(last.get("rx"))
-                                cur = int(rx_oct)
-                                delta = cur - prev
+                                delta = rx_oct - last["rx"]
                                 if not use_hc and delta < 0:
                                     delta += 2 ** 32
                                 rx_bps = (delta * 8.0) / dt
                             if tx_oct is not None and last.get("tx") is not None:
-                                prev = int(last.get("tx"))
-                                cur = int(tx_oct)
-                                delta = cur - prev
+                                delta = tx_oct - last["tx"]
                                 if not use_hc and delta < 0:
                                     delta += 2 ** 32
                                 tx_bps = (delta * 8.0) / dt
@@ -1061,33 +1631,75 @@ class SwitchSnmpClient:
                     _LOGGER.debug("Bandwidth polling failed: %s", e)
                     self.cache["bandwidth"] = {}
 
-        return self.cache
+        self._settle_reps_timeouts()
+        return self._snapshot()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Copy of the cache for the coordinator.
+
+        The coordinator only notifies entities when the new data compares
+        unequal to the previous data, so each poll hands out its own copy:
+        ifTable rows are updated in place between walks and would otherwise
+        always compare equal to themselves.
+        """
+        snap = dict(self.cache)
+        snap["ifTable"] = {idx: dict(rec) for idx, rec in self.cache.get("ifTable", {}).items()}
+        return snap
 
     # ---------- mutations ----------
-    async def set_alias(self, if_index: int, alias: str) -> bool:
+    async def set_many(self, ops: list[tuple[int, str, Any]]) -> bool:
+        """Apply several (if_index, field, value) writes in one SET request.
+
+        field is a key of _WRITABLE_COLUMNS ("alias" or "admin"). On success
+        the new values are written into the cached ifTable and the next
+        refresh re-reads interface state rather than reusing it.
+        """
+        if not ops:
+            return True
         await self._ensure_engine()
         await self._ensure_target()
-        ok = await _do_set_alias(self.engine, self.community_data, self.target, self.context, if_index, alias)
+        varbinds = []
+        for if_index, field, value in ops:
+            column, typ = _WRITABLE_COLUMNS[field]
+            if field == "admin":
+                oid = self._admin_oid(if_index)
+            else:
+                oid = f"{column}.{if_index}"
+            varbinds.append((oid, typ(value)))
+        ok = await _do_set(self.engine, self.community_data, self.target, self.context, varbinds)
         if ok:
-            self.cache.setdefault("ifTable", {}).setdefault(if_index, {})["alias"] = alias
-        else:
+            table = self.cache.setdefault("ifTable", {})
+            for if_index, field, value in ops:
+                table.setdefault(if_index, {})[field] = value
+            self._dynamic_ts = 0.0
+        return ok
+
+    async def set_alias(self, if_index: int, alias: str) -> bool:
+        ok = await self.set_many([(if_index, "alias", alias)])
+        if not ok:
             _LOGGER.warning("Failed to set alias via SNMP on ifIndex %s", if_index)
         return ok
 
     async def set_admin_status(self, if_index: int, value: int) -> bool:
-        await self._ensure_engine()
-        await self._ensure_target()
-        return await _do_set_admin_status(self.engine, self.community_data, self.target, self.context, if_index, value)
+        return await self.set_many([(if_index, "admin", value)])
 
 
 # ---------- helpers for config_flow ----------
 
 async def test_connection(hass: HomeAssistant, host: str, community: str, port: int) -> bool:
-    client = SwitchSnmpClient(hass, host, community, port)
-    sysname = await client._async_get_one(OID_sysName)
-    return sysname is not None
+    return await get_sysname(hass, host, community, port) is not None
 
 
 async def get_sysname(hass: HomeAssistant, host: str, community: str, port: int) -> Optional[str]:
-    client = SwitchSnmpClient(hass, host, community, port)
-    return await client._async_get_one(OID_sysName)
+    # One-off probe: not cached, so aborted flows and mistyped hosts don't
+    # leave a transport behind.
+    target = await UdpTransportTarget.create(
+        (host, port), timeout=DEFAULT_SNMP_TIMEOUT, retries=DEFAULT_SNMP_RETRIES
+    )
+    return await _do_get_one(
+        await _get_engine(hass),
+        CommunityData(community, mpModel=1),
+        target,
+        ContextData(),
+        OID_sysName,
+    )
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+from functools import lru_cache
 from typing import Any, Dict, Optional
 
 from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import entity_registry as er
 
 from .const import (
-    DOMAIN,
     CONF_PORT_RENAME_USER_RULES,
     CONF_PORT_RENAME_DISABLED_DEFAULT_IDS,
     DEFAULT_PORT_RENAME_RULES,
@@ -23,63 +26,175 @@ from .const import (
     CONF_DISABLED_VENDOR_FILTER_RULE_IDS,
 )
 from .snmp import SwitchSnmpClient
-from .helpers import format_interface_name
+from .helpers import (
+    EMPTY_DICT,
+    clean_match_list,
+    detect_vendor_family,
+    format_interface_name,
+    is_port_channel,
+    name_matcher,
+    vendor_filter_allows,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+# (threshold, unit), largest first; the threshold is also the divisor.
+_SPEED_UNITS = (
+    (1_000_000_000, "Gbps"),
+    (1_000_000, "Mbps"),
+    (1_000, "Kbps"),
+)
+
+
 def _format_bps(bps: Any) -> str:
     """Format an integer bits-per-second value into a human-friendly string."""
     try:
         v = int(bps)
     except Exception:
         return "Unknown"
+    return _format_bps_int(v)
+
+
+@lru_cache(maxsize=128)
+def _format_bps_int(v: int) -> str:
+    # A switch only has a handful of distinct port speeds, so nearly every
+    # call is a cache hit.
     if v <= 0:
         return "Unknown"
-    if v >= 1_000_000_000:
-        g = v / 1_000_000_000
-        return f"{g:g} Gbps"
-    if v >= 1_000_000:
-        m = v / 1_000_000
-        return f"{m:g} Mbps"
-    if v >= 1_000:
-        k = v / 1_000
-        return f"{k:g} Kbps"
+    for threshold, unit in _SPEED_UNITS:
+        if v >= threshold:
+            return f"{v / threshold:g} {unit}"
     return f"{v} bps"
 
-ADMIN_STATE = {1: "Up", 2: "Down", 3: "Testing"}
-OPER_STATE = {
-    1: "Up",
-    2: "Down",
-    3: "Testing",
-    4: "Unknown",
-    5: "Dormant",
-    6: "NotPresent",
-    7: "LowerLayerDown",
-}
+_PREFIX_LITERAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789:_- /")
+_INLINE_FLAGS_RE = re.compile(r"\(\?[aiLmsux-]")
+
+
+def _rule_prefix(pattern: str) -> str:
+    """Lowercase literal every match of an anchored rename pattern starts with.
+
+    Lets _apply_port_rename skip rules with a cheap startswith instead of
+    running the regex. Only plain "^literal..." patterns qualify: anything
+    with alternation or inline flags returns "" (always try the rule).
+    """
+    if not pattern.startswith("^") or "|" in pattern or _INLINE_FLAGS_RE.search(pattern):
+        return ""
+    prefix: list[str] = []
+    for ch in pattern[1:].lower():
+        if ch in "?*+{":
+            # The preceding literal is optional/repeated.
+            if prefix:
+                prefix.pop()
+            break
+        if ch not in _PREFIX_LITERAL_CHARS:
+            break
+        prefix.append(ch)
+    return "".join(prefix)
+
+
+def _compile_rename_rule(rule_id: str, pattern: str, replace: str) -> tuple[str, re.Pattern[str], str, str]:
+    return (rule_id, re.compile(pattern, re.IGNORECASE), replace, _rule_prefix(pattern))
+
+
+# Built-in rename rules never change at runtime, so compile them once at
+# import instead of on every platform setup (i.e. every reload).
+_DEFAULT_RENAME_RULES: tuple[tuple[str, re.Pattern[str], str, str], ...] = tuple(
+    _compile_rename_rule(r["id"], r["pattern"].strip(), str(r.get("replace") or ""))
+    for r in DEFAULT_PORT_RENAME_RULES
+    if r.get("id") and (r.get("pattern") or "").strip()
+)
+
+# "Gi1/0/1" style names: a two-character prefix followed by unit/slot/port
+# (further "/" segments are allowed). One match replaces the split/int parse.
+_UNIT_SLOT_PORT_RE = re.compile(r"^..(\d+)/(\d+)/(\d+)(?:/|$)", re.S)
+
+
+def _apply_port_rename(rules: tuple[tuple[str, re.Pattern[str], str, str], ...], display_name: str) -> str:
+    """Apply the first matching rename rule to the base display name."""
+    if not display_name or not rules:
+        return display_name
+    # Prefix checks are only exact for ASCII names (IGNORECASE folding of
+    # other scripts can differ from str.lower()).
+    name_l = display_name.lower() if display_name.isascii() else None
+    for _rid, rx, rep, prefix in rules:
+        if prefix and name_l is not None and not name_l.startswith(prefix):
+            continue
+        # One scan per rule: subn both finds and replaces the match.
+        try:
+            renamed, hits = rx.subn(rep, display_name, count=1)
+        except Exception:
+            # Bad replacement template: only a matching rule stops the chain.
+            if rx.search(display_name):
+                return display_name
+            continue
+        if hits:
+            return renamed
+    return display_name
+
+
+@lru_cache(maxsize=1024)
+def _port_display_name(rules: tuple[tuple[str, re.Pattern[str], str, str], ...], name: str) -> str:
+    """Display name for a (stripped) raw interface name under the given rename rules.
+
+    Rules only change with the entry options, so reloads (and devices sharing
+    the default rules) resolve names they have already seen from the cache.
+    """
+    # Apply per-device port rename rules to the *raw* interface name first.
+    # This allows rules to match vendor-specific raw strings (e.g. "Unit: ...") before any normalization.
+    raw_for_display = _apply_port_rename(rules, name)
+
+    # Try to parse Gi1/0/1 style to preserve unit/slot/port in display name.
+    # Cheap probes first: most other names (Vlan1, ge-0/0/1, lo0) fail
+    # these without entering the regex engine.
+    m = (
+        _UNIT_SLOT_PORT_RE.match(raw_for_display)
+        if raw_for_display[2:3].isdigit() and "/" in raw_for_display
+        else None
+    )
+    if m:
+        unit, slot, port = map(int, m.groups())
+        display = format_interface_name(raw_for_display, unit=unit, slot=slot, port=port)
+    else:
+        display = format_interface_name(raw_for_display)
+    return _apply_port_rename(rules, display)
+
+
+# ifAdminStatus / ifOperStatus labels, indexed by the IF-MIB enum value
+# (slot 0 is not a valid value and doubles as the fallback).
+ADMIN_STATE = ("Unknown", "Up", "Down", "Testing")
+OPER_STATE = (
+    "Unknown",
+    "Up",
+    "Down",
+    "Testing",
+    "Unknown",
+    "Dormant",
+    "NotPresent",
+    "LowerLayerDown",
+)
+
+
+def _state_label(labels: tuple[str, ...], value: Any) -> str:
+    """Label for an IF-MIB status enum value ("Unknown" if out of range)."""
+    if isinstance(value, int) and 0 < value < len(labels):
+        return labels[value]
+    return "Unknown"
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
-    data = hass.data[DOMAIN][entry.entry_id]
+    data = entry.runtime_data
     client: SwitchSnmpClient = data["client"]
     coordinator = data["coordinator"]
 
-    entities: list[IfAdminSwitch] = []
-    desired_if_indexes: set[int] = set()
     iftable = client.cache.get("ifTable", {})
-    hostname = client.cache.get("sysName") or entry.data.get("name") or client.host
+    hostname = data["host_label"]
 
-    device_info = DeviceInfo(
-        identifiers={(DOMAIN, f"{client.host}:{client.port}:{client.community}")},
-        name=hostname,
-    )
+    device_info = data["device_info"]
 
-    ip_index = client.cache.get("ipIndex", {})
-    ip_mask = client.cache.get("ipMask", {})
-
-    def _build_port_rename_rules() -> list[tuple[str, re.Pattern[str], str]]:
-        """Return ordered (id, compiled_regex, replace) rules for this entry."""
-        rules: list[tuple[str, re.Pattern[str], str]] = []
+    def _build_port_rename_rules() -> tuple[tuple[str, re.Pattern[str], str, str], ...]:
+        """Return ordered (id, compiled_regex, replace, literal_prefix) rules for this entry."""
+        rules: list[tuple[str, re.Pattern[str], str, str]] = []
 
         disabled = set(entry.options.get(CONF_PORT_RENAME_DISABLED_DEFAULT_IDS) or [])
 
@@ -90,231 +205,111 @@ async def async_setup_entry(hass, entry, async_add_entities):
                 replace = str(r.get("replace") or "")
                 if not pattern:
                     continue
-                rules.append((f"user_{i}", re.compile(pattern, re.IGNORECASE), replace))
+                rules.append(_compile_rename_rule(f"user_{i}", pattern, replace))
             except Exception:
                 # Ignore invalid user rules (they should be validated in the UI)
                 continue
 
         # Built-in defaults next
-        for r in DEFAULT_PORT_RENAME_RULES:
-            rid = r.get("id") or ""
-            if not rid or rid in disabled:
-                continue
-            try:
-                pattern = str(r.get("pattern") or "").strip()
-                replace = str(r.get("replace") or "")
-                if not pattern:
-                    continue
-                rules.append((rid, re.compile(pattern, re.IGNORECASE), replace))
-            except Exception:
-                continue
+        rules.extend(rule for rule in _DEFAULT_RENAME_RULES if rule[0] not in disabled)
 
-        return rules
+        return tuple(rules)
 
     port_rename_rules = _build_port_rename_rules()
 
     # Include/Exclude interface rules (simple string match; include wins over exclude)
-    include_starts = [str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_STARTS_WITH, []) or []) if str(s).strip()]
-    include_contains = [str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_CONTAINS, []) or []) if str(s).strip()]
-    include_ends = [str(s).strip().lower() for s in (entry.options.get(CONF_INCLUDE_ENDS_WITH, []) or []) if str(s).strip()]
+    include_starts = clean_match_list(entry.options.get(CONF_INCLUDE_STARTS_WITH))
+    include_contains = clean_match_list(entry.options.get(CONF_INCLUDE_CONTAINS))
+    include_ends = clean_match_list(entry.options.get(CONF_INCLUDE_ENDS_WITH))
 
-    exclude_starts = [str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_STARTS_WITH, []) or []) if str(s).strip()]
-    exclude_contains = [str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_CONTAINS, []) or []) if str(s).strip()]
-    exclude_ends = [str(s).strip().lower() for s in (entry.options.get(CONF_EXCLUDE_ENDS_WITH, []) or []) if str(s).strip()]
+    exclude_starts = clean_match_list(entry.options.get(CONF_EXCLUDE_STARTS_WITH))
+    exclude_contains = clean_match_list(entry.options.get(CONF_EXCLUDE_CONTAINS))
+    exclude_ends = clean_match_list(entry.options.get(CONF_EXCLUDE_ENDS_WITH))
 
     any_include_rules = bool(include_starts or include_contains or include_ends)
+    any_exclude_rules = bool(exclude_starts or exclude_contains or exclude_ends)
+    include_match = name_matcher(include_starts, include_contains, include_ends)
+    exclude_match = name_matcher(exclude_starts, exclude_contains, exclude_ends)
 
     disabled_vendor_filter_ids = set(entry.options.get(CONF_DISABLED_VENDOR_FILTER_RULE_IDS, []) or [])
 
-    def _matches_any(name_l: str, starts: list[str], contains: list[str], ends: list[str]) -> bool:
-        return (
-            any(name_l.startswith(x) for x in starts)
-            or any(x in name_l for x in contains)
-            or any(name_l.endswith(x) for x in ends)
-        )
-
-    def _apply_port_rename(display_name: str) -> str:
-        """Apply the first matching rename rule to the base display name."""
-        if not display_name or not port_rename_rules:
-            return display_name
-        for _rid, rx, rep in port_rename_rules:
-            if rx.search(display_name):
-                try:
-                    return rx.sub(rep, display_name, count=1)
-                except Exception:
-                    return display_name
-        return display_name
-
-    # Vendor detection
-    manufacturer = (client.cache.get("manufacturer") or "").lower()
-    sys_descr = (client.cache.get("sysDescr") or "").lower()
-
-    # Cisco SG family
-    is_cisco_sg = manufacturer.startswith("sg") and sys_descr.startswith("sg")
-
-    # Detect Junos / Juniper EX series
-    manufacturer = (client.cache.get("manufacturer") or "").lower()
-    sys_descr = (client.cache.get("sysDescr") or "").lower()
-    is_junos = "juniper" in manufacturer or "junos" in sys_descr or "ex2200" in sys_descr
+    # Vendor detection (Cisco SG, Junos / Juniper EX series)
+    vendor_family = detect_vendor_family(client.cache.get("manufacturer"), client.cache.get("sysDescr"))
 
-    for idx, row in sorted(iftable.items()):
-        raw_name = row.get("name") or row.get("descr") or f"if{idx}"
-        alias = row.get("alias") or ""
+    def _selected_ports():
+        """Yield (if_index, display_name) for each interface to expose."""
+        for idx, row in sorted(iftable.items()):
+            raw_name = row.get("name") or row.get("descr") or f"if{idx}"
+            alias = row.get("alias") or ""
 
-        # Skip internal CPU pseudo-interface
-        if raw_name.strip().upper() == "CPU":
-            continue
-
-        lower = (raw_name or "").lower()
-        ip_str = _ip_for_index(idx, ip_index, ip_mask)
-
-        name_l = (raw_name or "").strip().lower()
-        include_hit = _matches_any(name_l, include_starts, include_contains, include_ends)
-        exclude_hit = _matches_any(name_l, exclude_starts, exclude_contains, exclude_ends)
-
-        # Exclude rules always win.
-        if exclude_hit:
-            continue
+            # Skip internal CPU pseudo-interface
+            name = raw_name.strip()
+            if name.upper() == "CPU":
+                continue
 
-        # If include rules exist, only matching interfaces are created.
-        if any_include_rules and not include_hit:
-            continue
+            # Lowercase once; the stripped form is derived from it.
+            lower = raw_name.lower()
+            ip_str = row.get("ip_display")
 
-        is_port_channel = (
-            lower.startswith("po")
-            or lower.startswith("port-channel")
-            or lower.startswith("link aggregate")
-        )
-        if is_port_channel and not (ip_str or alias):
-            # Only create PortChannel entity if configured (alias or IP present)
-            continue
+            # Most entries have no include/exclude rules; skip matching then.
+            include_hit = False
+            if any_include_rules or any_exclude_rules:
+                name_l = lower.strip()
+                include_hit = any_include_rules and include_match(name_l)
 
-        # Get interface details
-        name = raw_name.strip()
-        lower_name = name.lower()
-        admin = row.get("admin")
-        oper = row.get("oper")
-        has_ip = bool(ip_str)
-        include = False
-        
-
-        # Cisco SG interface selection rules (can disable individual built-in rules)
-        if is_cisco_sg:
-            enable_physical = "cisco_sg_physical_fa_gi" not in disabled_vendor_filter_ids
-            enable_vlan = "cisco_sg_vlan_admin_or_oper" not in disabled_vendor_filter_ids
-            enable_has_ip = "cisco_sg_other_has_ip" not in disabled_vendor_filter_ids
-
-            if enable_physical or enable_vlan or enable_has_ip:
-                name = raw_name.strip()
-                lower_name = name.lower()
-                admin = row.get("admin")
-                oper = row.get("oper")
-                has_ip = bool(ip_str)
-                include = False
-
-                if enable_physical and (lower_name.startswith("fa") or lower_name.startswith("gi")):
-                    include = True
-
-                elif enable_vlan and lower_name.startswith("vlan"):
-                    if oper == 1 or admin == 2:
-                        include = True
-
-                elif enable_has_ip and has_ip:
-                    include = True
-
-                if not include and not include_hit:
+                # Exclude rules always win.
+                if any_exclude_rules and exclude_match(name_l):
                     continue
 
-
-
-        # Junos (e.g. EX2200) interface selection rules (can disable individual built-in rules)
-        if is_junos:
-            enable_physical = "junos_physical_ge" not in disabled_vendor_filter_ids
-            enable_l3_subif = "junos_l3_subif_has_ip" not in disabled_vendor_filter_ids
-            enable_vlan = "junos_vlan_admin_or_oper" not in disabled_vendor_filter_ids
-            enable_has_ip = "junos_other_has_ip" not in disabled_vendor_filter_ids
-
-            if enable_physical or enable_l3_subif or enable_vlan or enable_has_ip:
-                name = raw_name.strip()
-                lower_name = name.lower()
-                admin = row.get("admin")
-                oper = row.get("oper")
-                has_ip = bool(ip_str)
-                include = False
-
-                # 1) Physical front-panel ports: ge-0/0/X (no subinterface suffix)
-                if enable_physical and lower_name.startswith("ge-") and "." not in name:
-                    include = True
-
-                # 2) L3 subinterfaces: ge-0/0/X.Y – only keep non-.0 with an IP address
-                elif enable_l3_subif and lower_name.startswith("ge-") and "." in name:
-                    base, sub = name.split(".", 1)
-                    if sub != "0" and has_ip:
-                        include = True
-
-                # 3) VLAN interfaces that are operationally up or administratively disabled
-                elif enable_vlan and lower_name.startswith("vlan"):
-                    if oper == 1 or admin == 2:
-                        include = True
-
-                # 4) Any other non-physical interface with an IP address configured
-                elif enable_has_ip and has_ip:
-                    include = True
-
-                if not include and not include_hit:
+                # If include rules exist, only matching interfaces are created.
+                if any_include_rules and not include_hit:
                     continue
 
+            if is_port_channel(lower) and not (ip_str or alias):
+                # Only create PortChannel entity if configured (alias or IP present)
+                continue
 
-                # Apply per-device port rename rules to the *raw* interface name first.
-        # This allows rules to match vendor-specific raw strings (e.g. "Unit: ...") before any normalization.
-        # _apply_port_rename() closes over port_rename_rules
-        raw_for_display = _apply_port_rename((raw_name or "").strip())
-
-# Try to parse Gi1/0/1 style to preserve unit/slot/port in display name
-        unit = 1
-        slot = 0
-        port = None
-        try:
-            # e.g., "Gi1/0/1" -> parts after the first two letters
-            if "/" in raw_for_display and raw_for_display[2:3].isdigit():
-                parts = raw_for_display[2:].split("/")
-                if len(parts) >= 3:
-                    unit = int(parts[0])
-                    slot = int(parts[1])
-                    port = int(parts[2])
-        except Exception:
-            pass
+            # Built-in vendor interface selection rules (individual rules can be
+            # disabled); an include-rule hit overrides them.
+            if not include_hit and not vendor_filter_allows(
+                vendor_family,
+                name,
+                row.get("admin"),
+                row.get("oper"),
+                bool(ip_str),
+                disabled_vendor_filter_ids,
+            ):
+                continue
 
-        display = format_interface_name(raw_for_display, unit=unit, slot=slot, port=port)
-        display = _apply_port_rename(display)
-
-        entities.append(
-            IfAdminSwitch(
-                coordinator=coordinator,
-                entry_id=entry.entry_id,
-                if_index=idx,
-                raw_name=raw_name,
-                display_name=display,
-                alias=alias,
-                hostname=hostname,
-                device_info=device_info,
-                client=client,
-            )
+            yield idx, _port_display_name(port_rename_rules, name)
+
+    entities = [
+        IfAdminSwitch(
+            coordinator=coordinator,
+            entry_id=entry.entry_id,
+            if_index=idx,
+            display_name=display,
+            hostname=hostname,
+            device_info=device_info,
+            client=client,
         )
-
-        desired_if_indexes.add(idx)
+        for idx, display in _selected_ports()
+    ]
+    desired_if_indexes = {entity._if_index for entity in entities}
 
     # Remove any previously-created switch entities that are no longer desired
     # (e.g. excluded by user rules). Without this, Home Assistant keeps the old
     # entities around even if we stop creating them.
     ent_reg = er.async_get(hass)
+    uid_prefix = f"{entry.entry_id}-if-"
     for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
         if ent.domain != "switch":
             continue
-        if not (ent.unique_id or "").startswith(f"{entry.entry_id}-if-"):
+        uid = ent.unique_id or ""
+        if not uid.startswith(uid_prefix):
             continue
         try:
-            old_idx = int((ent.unique_id or "").split("-if-", 1)[1])
+            old_idx = int(uid[len(uid_prefix):])
         except Exception:
             continue
         if old_idx not in desired_if_indexes:
@@ -322,92 +317,133 @@ async def async_setup_entry(hass, entry, async_add_entities):
 
     async_add_entities(entities)
 
-def _ip_for_index(if_index: int, ip_index: Dict[str, int], ip_mask: Dict[str, str]) -> Optional[str]:
-    """Return IP/maskbits string for an ifIndex if present."""
-    for ip, idx in ip_index.items():
-        if idx == if_index:
-            mask = ip_mask.get(ip)
-            if not mask:
-                return ip
-            try:
-                import ipaddress
-
-                net = ipaddress.IPv4Network((ip, mask), strict=False)
-                return f"{ip}/{net.prefixlen}"
-            except Exception:
-                return ip
-    return None
-
-
 class IfAdminSwitch(CoordinatorEntity, SwitchEntity):
+    # Entity keeps an instance __dict__ (and manages the _attr_* names), so
+    # only our own fields can be slotted; that still keeps them out of it.
+    # Only fields read after construction are stored at all.
+    __slots__ = (
+        "_if_index",
+        "_display",
+        "_client",
+        "_written",
+        "_present",
+        "_confirm_task",
+    )
+
     def __init__(
         self,
         coordinator,
         entry_id: str,
         if_index: int,
-        raw_name: str,
         display_name: str,
-        alias: str,
         hostname: str,
         device_info: DeviceInfo,
         client: SwitchSnmpClient,
     ):
         super().__init__(coordinator)
-        self._entry_id = entry_id
         self._if_index = if_index
-        self._raw_name = raw_name
         self._display = display_name
-        self._alias = alias
-        self._hostname = hostname
         self._client = client
 
         self._attr_unique_id = f"{entry_id}-if-{if_index}"
         # Name includes hostname so entity_id becomes e.g. switch.switch1_gi1_0_1
         self._attr_name = f"{hostname} {display_name}"
         self._attr_device_info = device_info
+        # (available, attributes) as of our last coordinator-driven write.
+        self._written: Optional[tuple[bool, Dict[str, Any]]] = None
+        self._confirm_task: Optional[asyncio.Task] = None
+        self._refresh_attrs()
 
     @property
-    def is_on(self) -> bool:
-        row = self.coordinator.data.get("ifTable", {}).get(self._if_index, {})
-        return row.get("admin") == 1
+    def available(self) -> bool:
+        # Requires the ifIndex to still be present in ifTable.
+        return super().available and self._present
 
     async def async_turn_on(self, **kwargs):
-        ok = await self._client.set_admin_status(self._if_index, 1)
-        if ok:
-            self.coordinator.data["ifTable"].setdefault(self._if_index, {})["admin"] = 1
-            self.async_write_ha_state()
+        await self._async_set_admin(1)
 
     async def async_turn_off(self, **kwargs):
-        ok = await self._client.set_admin_status(self._if_index, 2)
-        if ok:
-            self.coordinator.data["ifTable"].setdefault(self._if_index, {})["admin"] = 2
-            self.async_write_ha_state()
+        await self._async_set_admin(2)
+
+    async def _async_set_admin(self, value: int) -> None:
+        """Write ifAdminStatus (1=up, 2=down) and reflect it right away."""
+        if not await self._client.set_admin_status(self._if_index, value):
+            # Surface the failure instead of letting the toggle snap back silently.
+            raise HomeAssistantError(
+                f"Failed to set admin status of {self._display} (ifIndex {self._if_index}) via SNMP"
+            )
+        # coordinator.data is the snapshot the coordinator compares new polls
+        # against, so it is left alone: the optimistic admin value only goes
+        # into this entity's state (set_admin_status updated the client cache).
+        self._refresh_attrs(admin=value)
+        self.async_write_ha_state()
+        # What HA now shows; a refresh reporting the previous state must not
+        # be mistaken for "nothing changed" by the dedupe below.
+        self._written = (self.available, self._attr_extra_state_attributes)
+        # Confirm (and pick up the new oper status) without blocking the UI.
+        # The task belongs to the entry and is cancelled if we are removed.
+        if self._confirm_task is None or self._confirm_task.done():
+            self._confirm_task = self.platform.config_entry.async_create_background_task(
+                self.hass, self._async_confirm_admin(), f"{self.entity_id} confirm admin status"
+            )
 
-    @property
-    def extra_state_attributes(self) -> Dict[str, Any]:
-        row = self.coordinator.data.get("ifTable", {}).get(self._if_index, {})
+    async def _async_confirm_admin(self) -> None:
+        """Request a (debounced) re-poll and show what the device reports.
+
+        If the device still reports the pre-toggle state, the new data equals
+        the previous snapshot and the coordinator notifies nobody, so this
+        entity reconciles against the refreshed data itself.
+        """
+        await self.coordinator.async_request_refresh()
+        self._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        if self._confirm_task is not None:
+            self._confirm_task.cancel()
+        await super().async_will_remove_from_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        self._refresh_attrs()
+        # Any port change notifies every entity of the device; only write
+        # state when something this entity shows actually changed. The
+        # attributes include the admin label, so they cover _attr_is_on too.
+        current = (self.available, self._attr_extra_state_attributes)
+        if current == self._written:
+            return
+        self._written = current
+        super()._handle_coordinator_update()
+
+    def _refresh_attrs(self, admin: Optional[int] = None) -> None:
+        """Pull this port's row and rebuild state from the coordinator data.
+
+        Done once per coordinator update (and after a local toggle, which
+        passes the written admin value) rather than on every read of is_on /
+        extra_state_attributes; SwitchEntity serves is_on from _attr_is_on.
+        """
+        row = self.coordinator.data.get("ifTable", EMPTY_DICT).get(self._if_index)
+        self._present = row is not None
+        if row is None:
+            row = EMPTY_DICT
+        get = row.get
+        if admin is None:
+            admin = get("admin")
+        oper = get("oper")
+        self._attr_is_on = admin == 1
         attrs: Dict[str, Any] = {
             "Index": self._if_index,
             "Name": self._display,
-            "Alias": row.get("alias") or "",
-            "Admin": ADMIN_STATE.get(row.get("admin", 0), "Unknown"),
-            "Oper": OPER_STATE.get(row.get("oper", 0), "Unknown"),
-            "Speed": _format_bps(row.get("speed_bps")),
+            "Alias": get("alias") or "",
+            "Admin": _state_label(ADMIN_STATE, admin),
+            "Oper": _state_label(OPER_STATE, oper),
+            "Speed": _format_bps(get("speed_bps")),
         }
 
-        vlan_id = row.get("vlan_id")
-        if vlan_id is not None:
-            try:
-                vlan_int = int(vlan_id)
-            except Exception:
-                vlan_int = None
-            if vlan_int:
-                attrs["VLAN ID"] = vlan_int
-        ip = _ip_for_index(
-            self._if_index,
-            self.coordinator.data.get("ipIndex", {}),
-            self.coordinator.data.get("ipMask", {}),
-        )
+        # The client only stores positive integer PVIDs.
+        vlan_id = get("vlan_id")
+        if vlan_id:
+            attrs["VLAN ID"] = vlan_id
+        ip = row.get("ip_display")
         if ip:
             attrs["IP"] = ip
-        return attrs
+        self._attr_extra_state_attributes = attrs